@@ -7,7 +7,8 @@ Registers models and customizes admin interface.
 
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
-from django.utils.html import format_html
+from django.db.models import BooleanField, ExpressionWrapper, Q
+from django.db.models.functions import Now
 from .forms import CustomUserCreationForm, CustomUserChangeForm
 
 from .models import PasswordResetToken, User
@@ -41,6 +42,7 @@ class UserAdmin(BaseUserAdmin):
         'last_name',
     ]
     ordering = ['-date_joined']
+    list_select_related = ()
     readonly_fields = [
         'id',
         'date_joined',
@@ -91,11 +93,6 @@ class UserAdmin(BaseUserAdmin):
         }),
     )
 
-    def get_queryset(self, request):
-        """Optimize queryset with select_related."""
-        qs = super().get_queryset(request)
-        return qs.select_related()
-
 
 @admin.register(PasswordResetToken)
 class PasswordResetTokenAdmin(admin.ModelAdmin):
@@ -128,6 +125,7 @@ class PasswordResetTokenAdmin(admin.ModelAdmin):
         'is_valid_status',
     ]
     ordering = ['-created_at']
+    list_select_related = ('user',)
 
     fieldsets = (
         (None, {
@@ -147,15 +145,13 @@ class PasswordResetTokenAdmin(admin.ModelAdmin):
     token_preview.short_description = 'Token'
 
     def is_valid_status(self, obj):
-        """Display visual indicator of token validity."""
-        if obj.is_valid():
-            return format_html(
-                '<span style="color: green;">✓ Valid</span>'
-            )
-        return format_html(
-            '<span style="color: red;">✗ Invalid</span>'
-        )
+        """Display token validity, using the annotated flag when present."""
+        is_valid = getattr(obj, '_is_valid', None)
+        if is_valid is None:
+            return obj.is_valid()
+        return is_valid
     is_valid_status.short_description = 'Status'
+    is_valid_status.boolean = True
 
     def has_add_permission(self, request):
         """Disable manual token creation."""
@@ -166,6 +162,11 @@ class PasswordResetTokenAdmin(admin.ModelAdmin):
         return False
 
     def get_queryset(self, request):
-        """Optimize queryset with select_related."""
+        """Annotate token validity so it is evaluated in SQL once per row."""
         qs = super().get_queryset(request)
-        return qs.select_related('user')
\ No newline at end of file
+        return qs.annotate(
+            _is_valid=ExpressionWrapper(
+                Q(used=False) & Q(expires_at__gt=Now()),
+                output_field=BooleanField(),
+            )
+        )
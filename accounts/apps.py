@@ -12,11 +12,3 @@ class AccountsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'accounts'
     verbose_name = 'Accounts'
-
-    def ready(self):
-        """
-        Import signals when app is ready.
-
-        This method is called when Django starts.
-        """
-        pass
\ No newline at end of file
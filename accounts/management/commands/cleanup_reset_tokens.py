@@ -0,0 +1,35 @@
+# accounts/management/commands/cleanup_reset_tokens.py
+
+"""
+Management command to delete expired password reset tokens.
+
+Usage:
+    python manage.py cleanup_reset_tokens             # Keep tokens for 1 day after expiry
+    python manage.py cleanup_reset_tokens --days 7    # Keep tokens for 7 days after expiry
+
+Schedule it (e.g. daily via cron) to keep the token table small.
+"""
+
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from accounts import services
+
+
+class Command(BaseCommand):
+    help = "Delete password reset tokens that expired more than --days ago."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=1,
+            help="Days to keep tokens after they expire (default: 1).",
+        )
+
+    def handle(self, *args, **kwargs):
+        deleted = services.delete_expired_password_reset_tokens(
+            grace_period=timedelta(days=kwargs["days"])
+        )
+        self.stdout.write(self.style.SUCCESS(f"Deleted {deleted} expired reset token(s)."))
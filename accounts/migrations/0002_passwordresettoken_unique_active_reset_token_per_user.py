@@ -0,0 +1,39 @@
+# Generated by Django 5.2.9 on 2026-10-18 10:08
+
+from django.db import migrations, models
+
+
+def invalidate_duplicate_active_tokens(apps, schema_editor):
+    """Keep only the newest unused reset token per user."""
+    PasswordResetToken = apps.get_model('accounts', 'PasswordResetToken')
+    seen_users = set()
+    stale_ids = []
+    for token_id, user_id in (
+        PasswordResetToken.objects
+        .filter(used=False)
+        .order_by('user_id', '-created_at')
+        .values_list('id', 'user_id')
+    ):
+        if user_id in seen_users:
+            stale_ids.append(token_id)
+        else:
+            seen_users.add(user_id)
+    PasswordResetToken.objects.filter(id__in=stale_ids).update(used=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            invalidate_duplicate_active_tokens,
+            migrations.RunPython.noop,
+        ),
+        migrations.AddConstraint(
+            model_name='passwordresettoken',
+            constraint=models.UniqueConstraint(condition=models.Q(('used', False)), fields=('user',), name='unique_active_reset_token_per_user'),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.9 on 2026-10-18 10:10
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0002_passwordresettoken_unique_active_reset_token_per_user'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='passwordresettoken',
+            name='accounts_pa_token_affdf2_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='user',
+            name='accounts_us_email_74c8d6_idx',
+        ),
+        migrations.AlterField(
+            model_name='passwordresettoken',
+            name='token',
+            field=models.CharField(max_length=100, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='user',
+            name='email',
+            field=models.EmailField(max_length=255, unique=True, validators=[django.core.validators.EmailValidator()]),
+        ),
+    ]
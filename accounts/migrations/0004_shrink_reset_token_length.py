@@ -0,0 +1,18 @@
+# Generated by Django 5.2.9 on 2026-10-18 10:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0003_remove_redundant_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='passwordresettoken',
+            name='token',
+            field=models.CharField(max_length=64, unique=True),
+        ),
+    ]
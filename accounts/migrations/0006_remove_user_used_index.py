@@ -0,0 +1,17 @@
+# Generated by Django 5.2.9 on 2026-10-18 10:30
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0005_remove_duplicate_email_validator'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='passwordresettoken',
+            name='accounts_pa_user_id_fbc669_idx',
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.9 on 2026-10-18 16:40
+
+from django.db import migrations, models
+from django.db.models.functions import Lower
+
+
+def lowercase_emails(apps, schema_editor):
+    """Lowercase stored emails so exact lookups match normalized input."""
+    User = apps.get_model('accounts', 'User')
+    db_alias = schema_editor.connection.alias
+    users = User.objects.using(db_alias)
+
+    clashes = list(
+        users.annotate(email_lower=Lower('email'))
+        .values('email_lower')
+        .annotate(total=models.Count('id'))
+        .filter(total__gt=1)
+        .values_list('email_lower', flat=True)
+    )
+    if clashes:
+        raise RuntimeError(
+            'Cannot lowercase user emails; these addresses belong to more than '
+            'one account and must be merged first: ' + ', '.join(sorted(clashes))
+        )
+
+    users.exclude(email=Lower('email')).update(email=Lower('email'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0006_remove_user_used_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(lowercase_emails, migrations.RunPython.noop),
+    ]
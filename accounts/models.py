@@ -7,15 +7,30 @@ Defines User model for authentication and profile management.
 
 import uuid
 from django.contrib.auth.models import AbstractBaseUser, BaseUserManager, PermissionsMixin
-from django.core.validators import EmailValidator
 from django.db import models
 from django.utils import timezone
 from django.core.exceptions import ValidationError
 
+from .utils import normalize_email
+
+
+# Plain role values for comparisons in hot paths (permission checks)
+SUPER_ADMIN = 'SUPER_ADMIN'
+ESTATE_MANAGER = 'ESTATE_MANAGER'
+
 
 class UserManager(BaseUserManager):
     """Custom manager for User model."""
 
+    @classmethod
+    def normalize_email(cls, email):
+        """
+        Normalize the whole email address, not just the domain part.
+
+        Lookups match emails exactly, so the local part is lowercased too.
+        """
+        return normalize_email(email or '')
+
     def create_user(self, email, password=None, **extra_fields):
         """
         Create and return a regular user with email and password.
@@ -91,8 +106,6 @@ class User(AbstractBaseUser, PermissionsMixin):
     email = models.EmailField(
         max_length=255,
         unique=True,
-        validators=[EmailValidator()],
-        db_index=True
     )
     first_name = models.CharField(max_length=150, blank=True)
     last_name = models.CharField(max_length=150, blank=True)
@@ -122,7 +135,6 @@ class User(AbstractBaseUser, PermissionsMixin):
         verbose_name = 'User'
         verbose_name_plural = 'Users'
         indexes = [
-            models.Index(fields=['email']),
             models.Index(fields=['role']),
             models.Index(fields=['is_active']),
         ]
@@ -133,6 +145,8 @@ class User(AbstractBaseUser, PermissionsMixin):
 
     def get_full_name(self):
         """Return the user's full name."""
+        if not self.first_name and not self.last_name:
+            return self.email
         full_name = f'{self.first_name} {self.last_name}'.strip()
         return full_name or self.email
 
@@ -142,11 +156,11 @@ class User(AbstractBaseUser, PermissionsMixin):
 
     def is_super_admin(self):
         """Check if user is a super admin."""
-        return self.role == self.Role.SUPER_ADMIN
+        return self.role == SUPER_ADMIN
 
     def is_estate_manager(self):
         """Check if user is an estate manager."""
-        return self.role == self.Role.ESTATE_MANAGER
+        return self.role == ESTATE_MANAGER
 
 
     def clean(self):
@@ -170,7 +184,7 @@ class PasswordResetToken(models.Model):
         on_delete=models.CASCADE,
         related_name='password_reset_tokens'
     )
-    token = models.CharField(max_length=100, unique=True, db_index=True)
+    token = models.CharField(max_length=64, unique=True)
     expires_at = models.DateTimeField()
     used = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
@@ -180,9 +194,15 @@ class PasswordResetToken(models.Model):
         verbose_name = 'Password Reset Token'
         verbose_name_plural = 'Password Reset Tokens'
         indexes = [
-            models.Index(fields=['token']),
             models.Index(fields=['expires_at']),
-            models.Index(fields=['user', 'used']),
+        ]
+        constraints = [
+            # Also serves as the partial index for active-token lookups by user
+            models.UniqueConstraint(
+                fields=['user'],
+                condition=models.Q(used=False),
+                name='unique_active_reset_token_per_user',
+            ),
         ]
 
     def __str__(self):
@@ -191,4 +211,4 @@ class PasswordResetToken(models.Model):
 
     def is_valid(self):
         """Check if token is still valid and unused."""
-        return not self.used and timezone.now() < self.expires_at
\ No newline at end of file
+        return not self.used and timezone.now() < self.expires_at
@@ -1,6 +1,22 @@
 from rest_framework.permissions import BasePermission, SAFE_METHODS
 
 
+def request_is_super_admin(request):
+    """
+    Return whether the requesting user is a super admin.
+
+    The result is cached on the request so object-level checks,
+    which run once per object, and view code such as
+    UserViewSet.get_queryset reuse the view-level answer.
+    """
+    try:
+        return request.__dict__['_is_super_admin']
+    except KeyError:
+        is_super_admin = request.user.is_super_admin()
+        request._is_super_admin = is_super_admin
+        return is_super_admin
+
+
 class IsSuperAdmin(BasePermission):
     """
     Allows access only to super admins.
@@ -10,7 +26,7 @@ class IsSuperAdmin(BasePermission):
         return (
             request.user
             and request.user.is_authenticated
-            and request.user.is_super_admin()
+            and request_is_super_admin(request)
         )
 
 
@@ -27,13 +43,13 @@ class IsSuperAdminOrSelf(BasePermission):
 
         # Only super admins can CREATE users
         if view.action == "create":
-            return request.user.is_super_admin()
+            return request_is_super_admin(request)
 
         return True
 
     def has_object_permission(self, request, view, obj):
         # Super admins can access any user
-        if request.user.is_super_admin():
+        if request_is_super_admin(request):
             return True
 
         # Regular users can only access themselves
@@ -77,10 +93,10 @@ class IsSuperAdminOrReadOnly(BasePermission):
         if request.method in SAFE_METHODS:
             return True
 
-        return request.user.is_super_admin()
+        return request_is_super_admin(request)
 
     def has_object_permission(self, request, view, obj):
         if request.method in SAFE_METHODS:
             return True
 
-        return request.user.is_super_admin()
+        return request_is_super_admin(request)
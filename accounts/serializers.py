@@ -10,6 +10,8 @@ from django.contrib.auth.password_validation import validate_password
 from rest_framework import serializers
 from rest_framework_simplejwt.tokens import RefreshToken
 
+from .utils import normalize_email
+
 User = get_user_model()
 
 
@@ -21,11 +23,11 @@ class UserSerializer(serializers.ModelSerializer):
     """
     # tokens = serializers.SerializerMethodField()
 
-    full_name = serializers.SerializerMethodField()
+    full_name = serializers.ReadOnlyField(source='get_full_name')
 
     class Meta:
         model = User
-        fields = [
+        fields = (
             'id',
             'email',
             'first_name',
@@ -38,23 +40,20 @@ class UserSerializer(serializers.ModelSerializer):
             'created_at',
             'updated_at',
             # 'tokens', 
-        ]
-        read_only_fields = [
+        )
+        read_only_fields = (
             'id',
             'date_joined',
             'last_login',
             'created_at',
             'updated_at',
-        ]
+        )
     # def get_tokens(self, obj):
     #     refresh = RefreshToken.for_user(obj)
     #     return {
     #         'refresh': str(refresh),
     #         'access': str(refresh.access_token),
     #     }
-    def get_full_name(self, obj):
-        """Return user's full name."""
-        return obj.get_full_name()
 
 
 class UserCreateSerializer(serializers.ModelSerializer):
@@ -89,9 +88,12 @@ class UserCreateSerializer(serializers.ModelSerializer):
 
     def validate_email(self, value):
         """Validate email is unique."""
-        if User.objects.filter(email__iexact=value).exists():
+        # The manager stores emails lowercased, so an exact match is
+        # case-insensitive and uses the unique index
+        value = normalize_email(value)
+        if User.objects.filter(email=value).exists():
             raise serializers.ValidationError('A user with this email already exists.')
-        return value.lower()
+        return value
 
     def validate(self, attrs):
         """Validate password confirmation matches."""
@@ -176,7 +178,7 @@ class PasswordResetRequestSerializer(serializers.Serializer):
         #     raise serializers.ValidationError(
         #         'No active user found with this email address.'
         #     )
-        return value.lower()
+        return normalize_email(value)
 
 
 class PasswordResetConfirmSerializer(serializers.Serializer):
@@ -224,4 +226,4 @@ class LoginSerializer(serializers.Serializer):
 
     def validate_email(self, value):
         """Normalize email to lowercase."""
-        return value.lower()
\ No newline at end of file
+        return normalize_email(value)
\ No newline at end of file
@@ -5,19 +5,25 @@ Business logic for accounts app.
 Contains all domain logic for user management and authentication.
 """
 
-import secrets
+import uuid
 from datetime import timedelta
-from typing import Optional
+from typing import Iterator, Optional
 
 from django.contrib.auth import authenticate, get_user_model
-from django.db import transaction
+from django.db import IntegrityError, transaction
 from django.utils import timezone
 
-from .models import PasswordResetToken
+from .models import ESTATE_MANAGER, PasswordResetToken
+from .utils import normalize_email
 from django.contrib.auth.models import AbstractBaseUser
 
 User = get_user_model()
 
+PROFILE_FIELDS = ('first_name', 'last_name')
+
+# Columns loaded when streaming users for bulk operations (emails, exports)
+BULK_USER_FIELDS = ('id', 'email', 'first_name', 'last_name', 'role')
+
 
 def create_user(
     *,
@@ -45,23 +51,30 @@ def create_user(
     Raises:
         ValueError: If validation fails or email already exists
     """
-    email = email.lower().strip()
+    email = normalize_email(email)
 
-    if User.objects.filter(email=email).exists():
-        raise ValueError(f'User with email {email} already exists')
-    
     # Remove password_confirm from kwargs if it exists
     kwargs.pop('password_confirm', None)
 
-
-    user = User.objects.create_user(
-        email=email,
-        password=password,
-        first_name=first_name.strip(),
-        last_name=last_name.strip(),
-        role=role,
-        **kwargs
-    )
+    # The unique constraint on email closes the race between a caller's
+    # uniqueness check and this insert; the savepoint keeps a failed insert
+    # from breaking an enclosing transaction
+    try:
+        with transaction.atomic():
+            user = User.objects.create_user(
+                email=email,
+                password=password,
+                first_name=first_name.strip(),
+                last_name=last_name.strip(),
+                role=role,
+                **kwargs
+            )
+    except IntegrityError:
+        # Other violations (NOT NULL, foreign keys from kwargs) are not
+        # duplicates and propagate unchanged
+        if not User.objects.filter(email=email).exists():
+            raise
+        raise ValueError(f'User with email {email} already exists')
 
     return user
 
@@ -92,8 +105,12 @@ def update_user_profile(
     if last_name is not None:
         user.last_name = last_name.strip()
 
-    user.full_clean()
-    user.save(update_fields=['first_name', 'last_name', 'updated_at'])
+    # Only the name fields change here, so skip clean() and the other validators
+    user.clean_fields(exclude=[
+        field.name for field in user._meta.concrete_fields
+        if field.name not in PROFILE_FIELDS
+    ])
+    user.save(update_fields=[*PROFILE_FIELDS, 'updated_at'])
 
     return user
 
@@ -141,7 +158,7 @@ def authenticate_user(*, email: str, password: str) -> Optional[AbstractBaseUser
     Raises:
         ValueError: If user is inactive
     """
-    email = email.lower().strip()
+    email = normalize_email(email)
     user = authenticate(email=email, password=password)
 
     if user is not None and not user.is_active:
@@ -163,7 +180,7 @@ def generate_password_reset_token(*, email: str) -> PasswordResetToken:
     Raises:
         ValueError: If user not found or inactive
     """
-    email = email.lower().strip()
+    email = normalize_email(email)
 
     try:
         user = User.objects.get(email=email, is_active=True)
@@ -171,19 +188,15 @@ def generate_password_reset_token(*, email: str) -> PasswordResetToken:
         raise ValueError('No active user found with this email address')
 
     with transaction.atomic():
-        PasswordResetToken.objects.filter(
-            user=user,
-            used=False,
-            expires_at__gt=timezone.now()
-        ).update(used=True)
-
-        token = secrets.token_urlsafe(32)
-        expires_at = timezone.now() + timedelta(hours=24)
+        # Retire the previous token rather than overwrite it, so its row and
+        # created_at stay for the audit trail; at most one token is unused
+        PasswordResetToken.objects.filter(user=user, used=False).update(used=True)
 
         reset_token = PasswordResetToken.objects.create(
             user=user,
-            token=token,
-            expires_at=expires_at
+            # Two uuid4s give 256 random bits as a fixed-width 64-char hex string
+            token=uuid.uuid4().hex + uuid.uuid4().hex,
+            expires_at=timezone.now() + timedelta(hours=24),
         )
 
     return reset_token
@@ -204,9 +217,10 @@ def reset_password_with_token(*, token: str, new_password: str) -> AbstractBaseU
         ValueError: If token is invalid, expired, or already used
     """
     try:
-        reset_token = PasswordResetToken.objects.select_related('user').get(
-            token=token
-        )
+        # Only the columns needed to validate the token and set the password
+        reset_token = PasswordResetToken.objects.select_related('user').only(
+            'id', 'used', 'expires_at', 'user__id', 'user__password'
+        ).get(token=token)
     except PasswordResetToken.DoesNotExist:
         raise ValueError('Invalid reset token')
 
@@ -224,6 +238,27 @@ def reset_password_with_token(*, token: str, new_password: str) -> AbstractBaseU
     return user
 
 
+def delete_expired_password_reset_tokens(
+    *,
+    grace_period: timedelta = timedelta(days=1)
+) -> int:
+    """
+    Delete password reset tokens that expired more than grace_period ago.
+
+    Intended to be run periodically (see the cleanup_reset_tokens
+    management command) so the token table and its indexes stay small.
+
+    Args:
+        grace_period: How long to keep tokens after they expire
+
+    Returns:
+        Number of tokens deleted
+    """
+    cutoff = timezone.now() - grace_period
+    deleted, _ = PasswordResetToken.objects.filter(expires_at__lt=cutoff).delete()
+    return deleted
+
+
 def deactivate_user(*, user: AbstractBaseUser) -> AbstractBaseUser:
     """
     Deactivate a user account.
@@ -272,7 +307,7 @@ def get_user_by_email(*, email: str) -> Optional[AbstractBaseUser]:
     Returns:
         User instance if found, None otherwise
     """
-    email = email.lower().strip()
+    email = normalize_email(email)
 
     try:
         return User.objects.get(email=email)
@@ -298,6 +333,24 @@ def get_estate_managers_queryset():
         QuerySet of User instances with ESTATE_MANAGER role
     """
     return User.objects.filter(
-        role=User.Role.ESTATE_MANAGER,
+        role=ESTATE_MANAGER,
         is_active=True
-    )
\ No newline at end of file
+    )
+
+
+def get_active_users_iterator(*, chunk_size: int = 2000) -> Iterator[AbstractBaseUser]:
+    """
+    Stream active users for bulk operations in constant memory.
+
+    Only BULK_USER_FIELDS are loaded; accessing other fields triggers
+    an extra query per user.
+
+    Args:
+        chunk_size: Number of rows fetched from the database per batch
+
+    Returns:
+        Iterator of active User instances
+    """
+    return get_active_users_queryset().only(*BULK_USER_FIELDS).iterator(
+        chunk_size=chunk_size
+    )
@@ -19,27 +19,16 @@ from .serializers import (
     UserUpdateSerializer,
 )
 
-# Common response schemas
-user_response_schema = openapi.Response(
-    description="User object",
-    schema=openapi.Schema(
-        type=openapi.TYPE_OBJECT,
-        properties={
-            'id': openapi.Schema(type=openapi.TYPE_STRING, format='uuid'),
-            'email': openapi.Schema(type=openapi.TYPE_STRING, format='email'),
-            'first_name': openapi.Schema(type=openapi.TYPE_STRING),
-            'last_name': openapi.Schema(type=openapi.TYPE_STRING),
-            'full_name': openapi.Schema(type=openapi.TYPE_STRING),
-            'role': openapi.Schema(type=openapi.TYPE_STRING, enum=['SUPER_ADMIN', 'ESTATE_MANAGER']),
-            'is_active': openapi.Schema(type=openapi.TYPE_BOOLEAN),
-            'date_joined': openapi.Schema(type=openapi.TYPE_STRING, format='date-time'),
-            'last_login': openapi.Schema(type=openapi.TYPE_STRING, format='date-time', nullable=True),
-            'created_at': openapi.Schema(type=openapi.TYPE_STRING, format='date-time'),
-            'updated_at': openapi.Schema(type=openapi.TYPE_STRING, format='date-time'),
-        }
-    )
+# Shared leaf schemas, reused instead of rebuilding identical nodes
+_STR = openapi.Schema(type=openapi.TYPE_STRING)
+_DETAIL_SCHEMA = openapi.Schema(
+    type=openapi.TYPE_OBJECT,
+    properties={
+        'detail': _STR,
+    }
 )
 
+# Common response schemas
 error_response_schema = openapi.Response(
     description="Error response",
     schema=openapi.Schema(
@@ -50,20 +39,6 @@ error_response_schema = openapi.Response(
     )
 )
 
-validation_error_schema = openapi.Response(
-    description="Validation error",
-    schema=openapi.Schema(
-        type=openapi.TYPE_OBJECT,
-        properties={
-            'field_name': openapi.Schema(
-                type=openapi.TYPE_ARRAY,
-                items=openapi.Schema(type=openapi.TYPE_STRING),
-                description='List of validation errors for this field'
-            ),
-        }
-    )
-)
-
 # Register endpoint documentation
 register_schema = swagger_auto_schema(
     operation_id='register_user',
@@ -234,12 +209,7 @@ activate_user_schema = swagger_auto_schema(
     responses={
         status.HTTP_200_OK: openapi.Response(
             description="User activated successfully",
-            schema=openapi.Schema(
-                type=openapi.TYPE_OBJECT,
-                properties={
-                    'detail': openapi.Schema(type=openapi.TYPE_STRING),
-                }
-            )
+            schema=_DETAIL_SCHEMA
         ),
         status.HTTP_403_FORBIDDEN: error_response_schema,
     },
@@ -254,12 +224,7 @@ deactivate_user_schema = swagger_auto_schema(
     responses={
         status.HTTP_200_OK: openapi.Response(
             description="User deactivated successfully",
-            schema=openapi.Schema(
-                type=openapi.TYPE_OBJECT,
-                properties={
-                    'detail': openapi.Schema(type=openapi.TYPE_STRING),
-                }
-            )
+            schema=_DETAIL_SCHEMA
         ),
         status.HTTP_400_BAD_REQUEST: error_response_schema,
         status.HTTP_403_FORBIDDEN: error_response_schema,
@@ -3,17 +3,35 @@
 Global test fixtures for accounts app.
 """
 
+import uuid
+
 import pytest
+from django.contrib.auth import get_user_model
+from django.urls import reverse
 from rest_framework.test import APIClient
 from rest_framework_simplejwt.tokens import RefreshToken
 
 from .factories import UserFactory
 
+User = get_user_model()
+
+
+@pytest.fixture(scope='session')
+def shared_client():
+    """
+    Single APIClient reused by the client fixtures below.
+
+    Each client fixture resets it on teardown. They all return the same
+    object, so a test should request only one of them.
+    """
+    return APIClient()
+
 
 @pytest.fixture
-def api_client():
+def api_client(shared_client):
     """Unauthenticated API client."""
-    return APIClient()
+    yield shared_client
+    shared_client.force_authenticate(user=None)
 
 
 @pytest.fixture
@@ -29,11 +47,11 @@ def authenticated_user(db):
 
 
 @pytest.fixture
-def authenticated_client(authenticated_user):
+def authenticated_client(shared_client, authenticated_user):
     """API client authenticated as standard user."""
-    client = APIClient()
-    client.force_authenticate(user=authenticated_user)
-    return client
+    shared_client.force_authenticate(user=authenticated_user)
+    yield shared_client
+    shared_client.force_authenticate(user=None)
 
 
 @pytest.fixture
@@ -52,34 +70,60 @@ def super_admin(db):
     )
 
 
+@pytest.fixture(scope='session')
+def unsaved_user():
+    """Unsaved estate manager for tests that never touch the database."""
+    return UserFactory.build()
+
+
+@pytest.fixture(scope='session')
+def unsaved_other_user():
+    """Second unsaved user for cross-user checks without the database."""
+    return UserFactory.build()
+
+
+@pytest.fixture(scope='session')
+def unsaved_super_admin():
+    """Unsaved super admin for tests that never touch the database."""
+    return UserFactory.build(
+        role='SUPER_ADMIN',
+        is_staff=True,
+        is_superuser=True
+    )
+
+
 @pytest.fixture
-def super_admin_client(super_admin):
+def super_admin_client(shared_client, super_admin):
     """API client authenticated as super admin."""
-    client = APIClient()
-    client.force_authenticate(user=super_admin)
-    return client
+    shared_client.force_authenticate(user=super_admin)
+    yield shared_client
+    shared_client.force_authenticate(user=None)
 
 
 @pytest.fixture
-def jwt_token(authenticated_user):
+def jwt_refresh(authenticated_user):
+    """RefreshToken for authenticated user, shared by the token fixtures."""
+    return RefreshToken.for_user(authenticated_user)
+
+
+@pytest.fixture
+def jwt_token(jwt_refresh):
     """JWT access token for authenticated user."""
-    refresh = RefreshToken.for_user(authenticated_user)
-    return str(refresh.access_token)
+    return str(jwt_refresh.access_token)
 
 
 @pytest.fixture
-def jwt_refresh_token(authenticated_user):
+def jwt_refresh_token(jwt_refresh):
     """JWT refresh token for authenticated user."""
-    refresh = RefreshToken.for_user(authenticated_user)
-    return str(refresh)
+    return str(jwt_refresh)
 
 
 @pytest.fixture
-def jwt_client(jwt_token):
+def jwt_client(shared_client, jwt_token):
     """API client with JWT authentication."""
-    client = APIClient()
-    client.credentials(HTTP_AUTHORIZATION=f'Bearer {jwt_token}')
-    return client
+    shared_client.credentials(HTTP_AUTHORIZATION=f'Bearer {jwt_token}')
+    yield shared_client
+    shared_client.force_authenticate(user=None)
 
 
 @pytest.fixture
@@ -89,6 +133,83 @@ def inactive_user(db):
 
 
 @pytest.fixture
-def multiple_users(db):
-    """Create multiple users for list/pagination tests."""
-    return UserFactory.create_batch(10)
\ No newline at end of file
+def bulk_users(db):
+    """
+    Background users for list and pagination tests.
+
+    Inserted with one bulk_create inside the test transaction; the factory
+    password is hashed once and cached.
+    """
+    return User.objects.bulk_create(UserFactory.build_batch(10))
+
+
+@pytest.fixture(scope='session')
+def register_url():
+    """URL for the register endpoint."""
+    return reverse('register')
+
+
+@pytest.fixture(scope='session')
+def login_url():
+    """URL for the login endpoint."""
+    return reverse('login')
+
+
+@pytest.fixture(scope='session')
+def password_reset_request_url():
+    """URL for the password reset request endpoint."""
+    return reverse('password-reset-request')
+
+
+@pytest.fixture(scope='session')
+def password_reset_confirm_url():
+    """URL for the password reset confirm endpoint."""
+    return reverse('password-reset-confirm')
+
+
+@pytest.fixture(scope='session')
+def user_list_url():
+    """URL for the user list endpoint."""
+    return reverse('user-list')
+
+
+@pytest.fixture(scope='session')
+def me_url():
+    """URL for the current user endpoint."""
+    return reverse('user-me')
+
+
+@pytest.fixture(scope='session')
+def update_profile_url():
+    """URL for the update profile endpoint."""
+    return reverse('user-update-profile')
+
+
+@pytest.fixture(scope='session')
+def change_password_url():
+    """URL for the change password endpoint."""
+    return reverse('user-change-password')
+
+
+def _detail_route(name):
+    """Reverse a per-user route once and return a pk -> path builder."""
+    placeholder = uuid.UUID(int=0)
+    return reverse(name, args=[placeholder]).replace(str(placeholder), '{}').format
+
+
+@pytest.fixture(scope='session')
+def user_detail_url():
+    """Builder for user detail URLs; call with the user's pk."""
+    return _detail_route('user-detail')
+
+
+@pytest.fixture(scope='session')
+def user_activate_url():
+    """Builder for user activate URLs; call with the user's pk."""
+    return _detail_route('user-activate')
+
+
+@pytest.fixture(scope='session')
+def user_deactivate_url():
+    """Builder for user deactivate URLs; call with the user's pk."""
+    return _detail_route('user-deactivate')
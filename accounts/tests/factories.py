@@ -3,21 +3,35 @@
 Factory Boy factories for accounts app models.
 """
 
+import secrets
+from functools import lru_cache
+
 import factory
 from factory.django import DjangoModelFactory
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
 from django.utils import timezone
 from datetime import timedelta
 
 User = get_user_model()
 
+DEFAULT_PASSWORD = 'TestPassword123!'
+
+
+@lru_cache(maxsize=None)
+def hash_password(raw_password):
+    """Hash a raw password once and reuse it for every factory user."""
+    return make_password(raw_password)
+
 
 class UserFactory(DjangoModelFactory):
     """Factory for User model."""
 
     class Meta:
         model = User
-        skip_postgeneration_save = True
+
+    class Params:
+        raw_password = DEFAULT_PASSWORD
 
     email = factory.Sequence(lambda n: f'user{n}@example.com')
     first_name = factory.Faker('first_name')
@@ -26,15 +40,8 @@ class UserFactory(DjangoModelFactory):
     is_active = True
     is_staff = False
     is_superuser = False
-
-    @factory.post_generation
-    def password(obj, create, extracted, **kwargs):
-        """Set password for user."""
-        if not create:
-            return
-        password = extracted if extracted else 'TestPassword123!'
-        obj.set_password(password)
-        obj.save()
+    # Set the hash up front so each user is a single INSERT
+    password = factory.LazyAttribute(lambda o: hash_password(o.raw_password))
 
 
 class PasswordResetTokenFactory(DjangoModelFactory):
@@ -44,6 +51,6 @@ class PasswordResetTokenFactory(DjangoModelFactory):
         model = 'accounts.PasswordResetToken'
 
     user = factory.SubFactory(UserFactory)
-    token = factory.Faker('sha256')
+    token = factory.LazyFunction(lambda: secrets.token_hex(32))
     expires_at = factory.LazyFunction(lambda: timezone.now() + timedelta(hours=24))
     used = False
\ No newline at end of file
@@ -3,13 +3,27 @@
 Shared test utilities for accounts app tests.
 """
 
-from rest_framework.test import APIClient
+from django.contrib.auth import get_user_model
+
+User = get_user_model()
+
+
+_DEFAULT_PAYLOAD = {
+    'first_name': 'Test',
+    'last_name': 'User',
+    'role': 'ESTATE_MANAGER',
+}
+
+_REQUIRED_USER_KEYS = frozenset({
+    'id', 'email', 'first_name', 'last_name', 'full_name',
+    'role', 'is_active', 'date_joined', 'created_at', 'updated_at'
+})
 
 
 def assert_response_has_keys(response_data, required_keys):
     """Assert response contains all required keys."""
-    for key in required_keys:
-        assert key in response_data, f'Missing key: {key}'
+    missing = frozenset(required_keys).difference(response_data)
+    assert not missing, f'Missing keys: {sorted(missing)}'
 
 
 def assert_error_response(response, status_code=400, field=None):
@@ -19,33 +33,33 @@ def assert_error_response(response, status_code=400, field=None):
         assert field in response.data
 
 
-def create_authenticated_client(user):
-    """Create an authenticated API client for a user."""
-    client = APIClient()
-    client.force_authenticate(user=user)
-    return client
+def assert_field_equals(model, pk, **expected):
+    """Assert the stored row holds the expected column values."""
+    row = model.objects.values(*expected).get(pk=pk)
+    assert row == expected
 
 
 def assert_user_response_structure(user_data):
     """Assert user response has correct structure."""
-    required_keys = [
-        'id', 'email', 'first_name', 'last_name', 'full_name',
-        'role', 'is_active', 'date_joined', 'created_at', 'updated_at'
-    ]
-    assert_response_has_keys(user_data, required_keys)
+    assert_response_has_keys(user_data, _REQUIRED_USER_KEYS)
     assert 'password' not in user_data
     assert 'tokens' in user_data
 
 
 def get_user_payload(email='test@example.com', password='TestPass123!', **kwargs):
     """Generate user creation payload."""
-    payload = {
+    return {
+        **_DEFAULT_PAYLOAD,
         'email': email,
-        'first_name': kwargs.get('first_name', 'Test'),
-        'last_name': kwargs.get('last_name', 'User'),
         'password': password,
         'password_confirm': password,
-        'role': kwargs.get('role', 'ESTATE_MANAGER'),
+        **kwargs,
     }
-    payload.update(kwargs)
-    return payload
\ No newline at end of file
+
+
+def get_user_payload_without(*fields, **kwargs):
+    """Generate user creation payload with the given fields left out."""
+    payload = get_user_payload(**kwargs)
+    for field in fields:
+        payload.pop(field, None)
+    return payload
@@ -0,0 +1,66 @@
+# tests/test_admin.py
+"""
+Tests for accounts app admin.
+
+Coverage:
+- Password reset token changelist and validity column
+"""
+
+from datetime import timedelta
+
+import pytest
+from django.contrib import admin
+from django.test import Client
+from django.urls import reverse
+from django.utils import timezone
+
+from accounts.admin import PasswordResetTokenAdmin
+from accounts.models import PasswordResetToken
+from .factories import PasswordResetTokenFactory
+
+
+@pytest.mark.django_db
+class TestPasswordResetTokenAdmin:
+    """Test PasswordResetTokenAdmin."""
+
+    @pytest.fixture
+    def admin_client(self, super_admin):
+        """Django test client logged in as a super admin."""
+        client = Client()
+        client.force_login(super_admin)
+        return client
+
+    def test_changelist_shows_token_validity(self, admin_client):
+        """Test the changelist renders annotated validity for each token."""
+        valid = PasswordResetTokenFactory.create()
+        expired = PasswordResetTokenFactory.create(
+            expires_at=timezone.now() - timedelta(hours=1)
+        )
+
+        response = admin_client.get(
+            reverse('admin:accounts_passwordresettoken_changelist')
+        )
+
+        assert response.status_code == 200
+        rows = {token.pk: token._is_valid for token in response.context['cl'].result_list}
+        assert rows == {valid.pk: True, expired.pk: False}
+
+    def test_change_view_renders(self, admin_client):
+        """Test the read-only change form renders the validity field."""
+        token = PasswordResetTokenFactory.create()
+
+        response = admin_client.get(
+            reverse('admin:accounts_passwordresettoken_change', args=[token.pk])
+        )
+
+        assert response.status_code == 200
+
+    @pytest.mark.parametrize('used, expected', [(False, True), (True, False)])
+    def test_validity_without_annotation(self, used, expected):
+        """Test objects not loaded through get_queryset fall back to is_valid."""
+        token = PasswordResetToken.objects.get(
+            pk=PasswordResetTokenFactory.create(used=used).pk
+        )
+        model_admin = PasswordResetTokenAdmin(PasswordResetToken, admin.site)
+
+        assert model_admin.is_valid_status(token) is expected
@@ -14,9 +14,13 @@ Coverage:
 """
 
 import pytest
+import secrets
+from django.db import IntegrityError, transaction
 from django.urls import reverse
 from django.utils import timezone
 from datetime import timedelta
+from accounts.models import PasswordResetToken
+from accounts.serializers import UserCreateSerializer, UserUpdateSerializer
 from .factories import UserFactory, PasswordResetTokenFactory
 from .helpers import get_user_payload
 
@@ -25,79 +29,51 @@ from .helpers import get_user_payload
 class TestEmptyAndNullValues:
     """Test handling of empty and null values."""
 
-    def test_registration_with_empty_email(self, api_client):
-        """Test registration fails with empty email."""
-        url = reverse('register')
-        payload = get_user_payload(email='')
-
-        response = api_client.post(url, payload, format='json')
-
-        assert response.status_code == 400
-        assert 'email' in response.data
-
-    def test_registration_with_whitespace_only_email(self, api_client):
-        """Test registration fails with whitespace-only email."""
-        url = reverse('register')
-        payload = get_user_payload(email='   ')
+    @pytest.mark.parametrize('field, value, expected_statuses', [
+        pytest.param('email', '', (400,), id='empty-email'),
+        pytest.param('email', '   ', (400,), id='whitespace-only-email'),
+        pytest.param('first_name', '', (201, 400), id='empty-first-name'),
+    ])
+    def test_registration_with_blank_field(
+        self, api_client, register_url, field, value, expected_statuses
+    ):
+        """Test registration with a blank or whitespace-only field."""
+        payload = get_user_payload(**{'email': 'blank@example.com', field: value})
 
-        response = api_client.post(url, payload, format='json')
+        response = api_client.post(register_url, payload, format='json')
 
-        assert response.status_code == 400
-        assert 'email' in response.data
+        assert response.status_code in expected_statuses
+        if expected_statuses == (400,):
+            assert field in response.data
 
-    def test_update_profile_with_empty_first_name(self, authenticated_client):
+    def test_update_profile_with_empty_first_name(
+        self, authenticated_client, update_profile_url
+    ):
         """Test profile update allows empty first name."""
-        url = reverse('user-update-profile')
         payload = {'first_name': ''}
 
-        response = authenticated_client.patch(url, payload, format='json')
+        response = authenticated_client.patch(update_profile_url, payload, format='json')
 
         assert response.status_code == 200
 
-    def test_registration_with_empty_first_name(self, api_client):
-        """Test registration with empty first name."""
-        url = reverse('register')
-        payload = get_user_payload(email='emptyname@example.com')
-        payload['first_name'] = ''
-
-        response = api_client.post(url, payload, format='json')
-
-        assert response.status_code in [201, 400]
-
 
 @pytest.mark.django_db
 class TestBoundaryValues:
     """Test boundary values and limits."""
 
-    def test_registration_with_very_long_email(self, api_client):
-        """Test registration with email at max length."""
-        long_email = 'a' * 240 + '@example.com'
-        url = reverse('register')
-        payload = get_user_payload(email=long_email)
-
-        response = api_client.post(url, payload, format='json')
-
-        assert response.status_code in [201, 400]
-
-    def test_registration_with_very_long_first_name(self, api_client):
-        """Test registration with very long first name."""
-        url = reverse('register')
-        payload = get_user_payload(email='longname@example.com')
-        payload['first_name'] = 'A' * 200
-
-        response = api_client.post(url, payload, format='json')
-
-        assert response.status_code in [201, 400]
-
-    def test_registration_with_maximum_length_password(self, api_client):
-        """Test registration with very long password."""
-        long_password = 'SecurePass123!' * 20
-        url = reverse('register')
-        payload = get_user_payload(email='longpass@example.com')
-        payload['password'] = long_password
-        payload['password_confirm'] = long_password
+    @pytest.mark.slow
+    @pytest.mark.parametrize('field, value', [
+        pytest.param('email', 'a' * 240 + '@example.com', id='long-email'),
+        pytest.param('first_name', 'A' * 200, id='long-first-name'),
+        pytest.param('password', 'SecurePass123!' * 20, id='long-password'),
+    ])
+    def test_registration_with_very_long_field(
+        self, api_client, register_url, field, value
+    ):
+        """Test registration with a field at or beyond its max length."""
+        payload = get_user_payload(**{'email': 'long@example.com', field: value})
 
-        response = api_client.post(url, payload, format='json')
+        response = api_client.post(register_url, payload, format='json')
 
         assert response.status_code in [201, 400]
 
@@ -106,37 +82,35 @@ class TestBoundaryValues:
 class TestUnicodeAndSpecialCharacters:
     """Test Unicode and special character handling."""
 
-    def test_registration_with_unicode_name(self, api_client):
+    def test_registration_with_unicode_name(self, api_client, register_url):
         """Test registration with Unicode characters in name."""
-        url = reverse('register')
-        payload = get_user_payload(email='unicode@example.com')
-        payload['first_name'] = 'José'
-        payload['last_name'] = 'François'
+        payload = get_user_payload(
+            email='unicode@example.com', first_name='José', last_name='François'
+        )
 
-        response = api_client.post(url, payload, format='json')
+        response = api_client.post(register_url, payload, format='json')
 
         assert response.status_code == 201
         assert response.data['first_name'] == 'José'
         assert response.data['last_name'] == 'François'
 
-    def test_registration_with_emoji_in_name(self, api_client):
+    def test_registration_with_emoji_in_name(self, api_client, register_url):
         """Test registration with emoji in name."""
-        url = reverse('register')
-        payload = get_user_payload(email='emoji@example.com')
-        payload['first_name'] = 'Test😀'
+        payload = get_user_payload(email='emoji@example.com', first_name='Test😀')
 
-        response = api_client.post(url, payload, format='json')
+        response = api_client.post(register_url, payload, format='json')
 
         assert response.status_code == 201
 
-    def test_registration_with_special_characters_in_name(self, api_client):
+    def test_registration_with_special_characters_in_name(
+        self, api_client, register_url
+    ):
         """Test registration with special characters."""
-        url = reverse('register')
-        payload = get_user_payload(email='special@example.com')
-        payload['first_name'] = "O'Brien"
-        payload['last_name'] = 'Smith-Jones'
+        payload = get_user_payload(
+            email='special@example.com', first_name="O'Brien", last_name='Smith-Jones'
+        )
 
-        response = api_client.post(url, payload, format='json')
+        response = api_client.post(register_url, payload, format='json')
 
         assert response.status_code == 201
         assert response.data['first_name'] == "O'Brien"
@@ -147,76 +121,75 @@ class TestUnicodeAndSpecialCharacters:
 class TestCaseSensitivity:
     """Test case sensitivity handling."""
 
-    def test_email_login_case_insensitive(self, api_client):
-        """Test login is case-insensitive for email."""
-        user = UserFactory.create(email='testuser@example.com')
+    def test_email_case_behaviors(
+        self,
+        subtests,
+        api_client,
+        authenticated_user,
+        login_url,
+        register_url,
+        password_reset_request_url,
+    ):
+        """Test email handling is case-insensitive across auth endpoints."""
+        upper_email = authenticated_user.email.upper()
 
-        url = reverse('login')
-        payload = {
-            'email': 'TESTUSER@EXAMPLE.COM',
-            'password': 'TestPassword123!',
-        }
+        with subtests.test('login with upper-case email'):
+            payload = {
+                'email': upper_email,
+                'password': 'TestPassword123!',
+            }
 
-        response = api_client.post(url, payload, format='json')
+            response = api_client.post(login_url, payload, format='json')
 
-        assert response.status_code == 200
+            assert response.status_code == 200
 
-    def test_duplicate_email_different_case_rejected(
-        self, api_client, authenticated_user
-    ):
-        """Test duplicate email with different case is rejected."""
-        url = reverse('register')
-        payload = get_user_payload(email=authenticated_user.email.upper())
+        with subtests.test('duplicate email with different case rejected'):
+            payload = get_user_payload(email=upper_email)
 
-        response = api_client.post(url, payload, format='json')
+            response = api_client.post(register_url, payload, format='json')
 
-        assert response.status_code == 400
-        assert 'email' in response.data
+            assert response.status_code == 400
+            assert 'email' in response.data
 
-    def test_password_reset_email_case_insensitive(
-        self, api_client, authenticated_user
-    ):
-        """Test password reset with different email case."""
-        url = reverse('password-reset-request')
-        payload = {'email': authenticated_user.email.upper()}
+        with subtests.test('password reset with upper-case email'):
+            payload = {'email': upper_email}
 
-        response = api_client.post(url, payload, format='json')
+            response = api_client.post(password_reset_request_url, payload, format='json')
 
-        assert response.status_code == 200
+            assert response.status_code == 200
 
 
 @pytest.mark.django_db
 class TestWhitespaceHandling:
     """Test whitespace handling in inputs."""
 
-    def test_registration_email_trimmed(self, api_client):
+    def test_registration_email_trimmed(self, api_client, register_url):
         """Test email whitespace is trimmed."""
-        url = reverse('register')
         payload = get_user_payload(email='  trimmed@example.com  ')
 
-        response = api_client.post(url, payload, format='json')
+        response = api_client.post(register_url, payload, format='json')
 
         if response.status_code == 201:
             assert response.data['email'] == 'trimmed@example.com'
 
-    def test_login_email_trimmed(self, api_client, authenticated_user):
+    def test_login_email_trimmed(self, api_client, authenticated_user, login_url):
         """Test login email whitespace is trimmed."""
-        url = reverse('login')
         payload = {
             'email': f'  {authenticated_user.email}  ',
             'password': 'TestPassword123!',
         }
 
-        response = api_client.post(url, payload, format='json')
+        response = api_client.post(login_url, payload, format='json')
 
         assert response.status_code == 200
 
-    def test_update_profile_name_trimmed(self, authenticated_client):
+    def test_update_profile_name_trimmed(
+        self, authenticated_client, update_profile_url
+    ):
         """Test profile update trims name whitespace."""
-        url = reverse('user-update-profile')
         payload = {'first_name': '  Trimmed  '}
 
-        response = authenticated_client.patch(url, payload, format='json')
+        response = authenticated_client.patch(update_profile_url, payload, format='json')
 
         assert response.status_code == 200
 
@@ -226,44 +199,45 @@ class TestExpiredTokens:
     """Test expired token handling."""
 
     def test_expired_password_reset_token_rejected(
-        self, api_client, authenticated_user
+        self, api_client, authenticated_user, password_reset_confirm_url
     ):
         """Test expired password reset token is rejected."""
-        expired_token = PasswordResetTokenFactory.create(
+        expired_token = PasswordResetToken.objects.create(
             user=authenticated_user,
+            token=secrets.token_hex(32),
             used=False,
             expires_at=timezone.now() - timedelta(hours=1)
         )
 
-        url = reverse('password-reset-confirm')
         payload = {
             'token': expired_token.token,
             'new_password': 'NewSecurePass123!',
             'new_password_confirm': 'NewSecurePass123!',
         }
 
-        response = api_client.post(url, payload, format='json')
+        response = api_client.post(password_reset_confirm_url, payload, format='json')
 
         assert response.status_code == 400
         assert 'detail' in response.data
 
     def test_used_password_reset_token_rejected(
-        self, api_client, authenticated_user
+        self, api_client, authenticated_user, password_reset_confirm_url
     ):
         """Test already used password reset token is rejected."""
-        used_token = PasswordResetTokenFactory.create(
+        used_token = PasswordResetToken.objects.create(
             user=authenticated_user,
-            used=True
+            token=secrets.token_hex(32),
+            used=True,
+            expires_at=timezone.now() + timedelta(hours=24)
         )
 
-        url = reverse('password-reset-confirm')
         payload = {
             'token': used_token.token,
             'new_password': 'NewSecurePass123!',
             'new_password_confirm': 'NewSecurePass123!',
         }
 
-        response = api_client.post(url, payload, format='json')
+        response = api_client.post(password_reset_confirm_url, payload, format='json')
 
         assert response.status_code == 400
 
@@ -295,41 +269,42 @@ class TestMultipleRequestsScenarios:
     """Test scenarios with multiple requests."""
 
     def test_multiple_password_reset_requests(
-        self, api_client, authenticated_user
+        self, api_client, authenticated_user, password_reset_request_url
     ):
         """Test multiple password reset requests invalidate old tokens."""
-        url = reverse('password-reset-request')
         payload = {'email': authenticated_user.email}
+        active_tokens = PasswordResetToken.objects.filter(
+            user=authenticated_user, used=False
+        )
 
-        response1 = api_client.post(url, payload, format='json')
-        token1 = response1.data['token']
+        response1 = api_client.post(password_reset_request_url, payload, format='json')
+        token1 = active_tokens.get().token
 
-        response2 = api_client.post(url, payload, format='json')
-        token2 = response2.data['token']
+        response2 = api_client.post(password_reset_request_url, payload, format='json')
+        token2 = active_tokens.get().token
 
         assert response1.status_code == 200
         assert response2.status_code == 200
         assert token1 != token2
 
-        from accounts.models import PasswordResetToken
+        # The old token keeps its row and is marked used
         old_token = PasswordResetToken.objects.get(token=token1)
         assert old_token.used is True
 
-    def test_login_updates_last_login(self, api_client, authenticated_user):
+    def test_login_updates_last_login(self, api_client, authenticated_user, login_url):
         """Test login updates last_login timestamp."""
         original_last_login = authenticated_user.last_login
 
-        url = reverse('login')
         payload = {
             'email': authenticated_user.email,
             'password': 'TestPassword123!',
         }
 
-        response = api_client.post(url, payload, format='json')
+        response = api_client.post(login_url, payload, format='json')
 
         assert response.status_code == 200
 
-        authenticated_user.refresh_from_db()
+        authenticated_user.refresh_from_db(fields=['last_login'])
         assert authenticated_user.last_login != original_last_login
 
 
@@ -337,58 +312,64 @@ class TestMultipleRequestsScenarios:
 class TestMalformedRequests:
     """Test malformed request handling."""
 
-    def test_registration_with_invalid_json(self, api_client):
+    def test_registration_with_invalid_json(self, api_client, register_url):
         """Test registration with malformed JSON."""
-        url = reverse('register')
-
         response = api_client.post(
-            url,
+            register_url,
             data='{"email": invalid json}',
             content_type='application/json'
         )
 
         assert response.status_code == 400
 
-    def test_registration_with_array_instead_of_object(self, api_client):
+    def test_registration_with_array_instead_of_object(self, api_client, register_url):
         """Test registration with array instead of object."""
-        url = reverse('register')
-
-        response = api_client.post(url, [], format='json')
+        response = api_client.post(register_url, [], format='json')
 
         assert response.status_code == 400
+        assert 'non_field_errors' in response.data
 
-    def test_update_profile_with_null_payload(self, authenticated_client):
-        """Test profile update with null payload."""
-        url = reverse('user-update-profile')
 
-        response = authenticated_client.patch(url, None, format='json')
+class TestNonObjectPayloads:
+    """Test serializers reject payloads that are not JSON objects."""
 
-        assert response.status_code == 400
+    def test_create_serializer_rejects_array_payload(self):
+        """Test UserCreateSerializer rejects an array payload."""
+        serializer = UserCreateSerializer(data=[])
+
+        assert not serializer.is_valid()
+        assert 'non_field_errors' in serializer.errors
+
+    def test_update_serializer_rejects_null_payload(self):
+        """Test UserUpdateSerializer rejects a null payload."""
+        serializer = UserUpdateSerializer(UserFactory.build(), data=None, partial=True)
+
+        assert not serializer.is_valid()
+        assert 'non_field_errors' in serializer.errors
 
 
 @pytest.mark.django_db
 class TestDatabaseIntegrity:
     """Test database integrity and constraints."""
 
-    def test_user_email_unique_constraint(self):
-        """Test email uniqueness at database level."""
-        UserFactory.create(email='unique@example.com')
-
-        from django.db import IntegrityError
-        with pytest.raises(IntegrityError):
-            UserFactory.create(email='unique@example.com')
-
-    def test_password_reset_token_unique_constraint(self, authenticated_user):
-        """Test token uniqueness at database level."""
-        token_value = 'unique-token-123'
-        PasswordResetTokenFactory.create(
-            user=authenticated_user,
-            token=token_value
-        )
+    def test_unique_constraints(self, subtests, authenticated_user):
+        """Test email and token uniqueness at database level."""
+        with subtests.test('user email'):
+            with pytest.raises(IntegrityError), transaction.atomic():
+                UserFactory.create(email=authenticated_user.email)
 
-        from django.db import IntegrityError
-        with pytest.raises(IntegrityError):
+        with subtests.test('password reset token'):
+            token_value = 'unique-token-123'
             PasswordResetTokenFactory.create(
                 user=authenticated_user,
                 token=token_value
-            )
\ No newline at end of file
+            )
+
+            # used=True so only the token column can collide, not the
+            # one-active-token-per-user constraint
+            with pytest.raises(IntegrityError), transaction.atomic():
+                PasswordResetTokenFactory.create(
+                    user=authenticated_user,
+                    token=token_value,
+                    used=True
+                )
@@ -10,6 +10,7 @@ Coverage:
 """
 
 import pytest
+from types import SimpleNamespace
 from unittest.mock import Mock
 from accounts.permissions import (
     IsSuperAdmin,
@@ -19,164 +20,149 @@ from accounts.permissions import (
 )
 # from .factories import UserFactory
 
+# Permission classes are stateless, so one instance of each is shared.
+# Requests stay per-test because the super admin check caches on them.
+_IS_SUPER_ADMIN = IsSuperAdmin()
+_IS_SUPER_ADMIN_OR_SELF = IsSuperAdminOrSelf()
+_IS_OWNER = IsOwner()
+_IS_SUPER_ADMIN_OR_READ_ONLY = IsSuperAdminOrReadOnly()
+_VIEW = SimpleNamespace(action='retrieve')
+_ANONYMOUS = SimpleNamespace(is_authenticated=False)
+
 
-@pytest.mark.django_db
 class TestIsSuperAdmin:
     """Test IsSuperAdmin permission class."""
 
-    def test_super_admin_has_permission(self, super_admin):
+    def test_super_admin_has_permission(self, unsaved_super_admin):
         """Test super admin user has permission."""
-        permission = IsSuperAdmin()
-        request = Mock(user=super_admin)
-        view = Mock()
+        request = SimpleNamespace(user=unsaved_super_admin)
 
-        assert permission.has_permission(request, view) is True
+        assert _IS_SUPER_ADMIN.has_permission(request, _VIEW) is True
 
-    def test_regular_user_has_no_permission(self, authenticated_user):
+    def test_regular_user_has_no_permission(self, unsaved_user):
         """Test regular user does not have permission."""
-        permission = IsSuperAdmin()
-        request = Mock(user=authenticated_user)
-        view = Mock()
+        request = SimpleNamespace(user=unsaved_user)
 
-        assert permission.has_permission(request, view) is False
+        assert _IS_SUPER_ADMIN.has_permission(request, _VIEW) is False
 
     def test_unauthenticated_user_has_no_permission(self):
         """Test unauthenticated user has no permission."""
-        permission = IsSuperAdmin()
-        request = Mock(user=Mock(is_authenticated=False))
-        view = Mock()
+        request = SimpleNamespace(user=_ANONYMOUS)
 
-        assert permission.has_permission(request, view) is False
+        assert _IS_SUPER_ADMIN.has_permission(request, _VIEW) is False
 
 
-@pytest.mark.django_db
 class TestIsSuperAdminOrSelf:
     """Test IsSuperAdminOrSelf permission class."""
 
-    def test_authenticated_user_has_view_permission(self, authenticated_user):
+    def test_authenticated_user_has_view_permission(self, unsaved_user):
         """Test authenticated user has view-level permission."""
-        permission = IsSuperAdminOrSelf()
-        request = Mock(user=authenticated_user)
-        view = Mock()
+        request = SimpleNamespace(user=unsaved_user)
 
-        assert permission.has_permission(request, view) is True
+        assert _IS_SUPER_ADMIN_OR_SELF.has_permission(request, _VIEW) is True
 
     def test_unauthenticated_user_has_no_permission(self):
         """Test unauthenticated user has no permission."""
-        permission = IsSuperAdminOrSelf()
-        request = Mock(user=Mock(is_authenticated=False))
-        view = Mock()
+        request = SimpleNamespace(user=_ANONYMOUS)
 
-        assert permission.has_permission(request, view) is False
+        assert _IS_SUPER_ADMIN_OR_SELF.has_permission(request, _VIEW) is False
 
-    def test_super_admin_has_object_permission_for_any_user(self, super_admin, other_user):
+    def test_super_admin_has_object_permission_for_any_user(
+        self, unsaved_super_admin, unsaved_other_user
+    ):
         """Test super admin can access any user object."""
-        permission = IsSuperAdminOrSelf()
-        request = Mock(user=super_admin)
-        view = Mock()
+        request = SimpleNamespace(user=unsaved_super_admin)
 
-        assert permission.has_object_permission(request, view, other_user) is True
+        assert _IS_SUPER_ADMIN_OR_SELF.has_object_permission(
+            request, _VIEW, unsaved_other_user
+        ) is True
 
-    def test_user_has_object_permission_for_self(self, authenticated_user):
+    def test_user_has_object_permission_for_self(self, unsaved_user):
         """Test user can access their own object."""
-        permission = IsSuperAdminOrSelf()
-        request = Mock(user=authenticated_user)
-        view = Mock()
+        request = SimpleNamespace(user=unsaved_user)
 
-        assert permission.has_object_permission(request, view, authenticated_user) is True
+        assert _IS_SUPER_ADMIN_OR_SELF.has_object_permission(
+            request, _VIEW, unsaved_user
+        ) is True
 
     def test_user_has_no_object_permission_for_other_user(
-        self, authenticated_user, other_user
+        self, unsaved_user, unsaved_other_user
     ):
         """Test user cannot access other user's object."""
-        permission = IsSuperAdminOrSelf()
-        request = Mock(user=authenticated_user)
-        view = Mock()
+        request = SimpleNamespace(user=unsaved_user)
+
+        assert _IS_SUPER_ADMIN_OR_SELF.has_object_permission(
+            request, _VIEW, unsaved_other_user
+        ) is False
+
+    def test_super_admin_check_cached_on_request(
+        self, unsaved_super_admin, unsaved_other_user
+    ):
+        """Test role check runs once per request across object checks."""
+        user = Mock(wraps=unsaved_super_admin, is_authenticated=True)
+        request = SimpleNamespace(user=user)
+        view = SimpleNamespace(action='create')
 
-        assert permission.has_object_permission(request, view, other_user) is False
+        assert _IS_SUPER_ADMIN_OR_SELF.has_permission(request, view) is True
+        assert _IS_SUPER_ADMIN_OR_SELF.has_object_permission(
+            request, view, unsaved_other_user
+        ) is True
+        assert user.is_super_admin.call_count == 1
 
 
-@pytest.mark.django_db
 class TestIsOwner:
     """Test IsOwner permission class."""
 
-    def test_owner_has_object_permission(self, authenticated_user):
+    def test_owner_has_object_permission(self, unsaved_user):
         """Test owner has permission for their object."""
-        permission = IsOwner()
-        request = Mock(user=authenticated_user)
-        view = Mock()
+        request = SimpleNamespace(user=unsaved_user)
 
-        assert permission.has_object_permission(request, view, authenticated_user) is True
+        assert _IS_OWNER.has_object_permission(request, _VIEW, unsaved_user) is True
 
-    def test_non_owner_has_no_object_permission(self, authenticated_user, other_user):
+    def test_non_owner_has_no_object_permission(self, unsaved_user, unsaved_other_user):
         """Test non-owner has no permission for other's object."""
-        permission = IsOwner()
-        request = Mock(user=authenticated_user)
-        view = Mock()
+        request = SimpleNamespace(user=unsaved_user)
 
-        assert permission.has_object_permission(request, view, other_user) is False
+        assert _IS_OWNER.has_object_permission(
+            request, _VIEW, unsaved_other_user
+        ) is False
 
 
-@pytest.mark.django_db
 class TestIsSuperAdminOrReadOnly:
     """Test IsSuperAdminOrReadOnly permission class."""
 
-    def test_unauthenticated_user_has_no_permission(self):
-        """Test unauthenticated user has no permission."""
-        permission = IsSuperAdminOrReadOnly()
-        request = Mock(user=Mock(is_authenticated=False), method='GET')
-        view = Mock()
-
-        assert permission.has_permission(request, view) is False
-
-    def test_authenticated_user_has_read_permission(self, authenticated_user):
-        """Test authenticated user has read permission."""
-        permission = IsSuperAdminOrReadOnly()
-        request = Mock(user=authenticated_user, method='GET')
-        view = Mock()
-
-        assert permission.has_permission(request, view) is True
-
-    def test_regular_user_has_no_write_permission(self, authenticated_user):
-        """Test regular user has no write permission."""
-        permission = IsSuperAdminOrReadOnly()
-        request = Mock(user=authenticated_user, method='POST')
-        view = Mock()
-
-        assert permission.has_permission(request, view) is False
-
-    def test_super_admin_has_write_permission(self, super_admin):
-        """Test super admin has write permission."""
-        permission = IsSuperAdminOrReadOnly()
-        request = Mock(user=super_admin, method='POST')
-        view = Mock()
-
-        assert permission.has_permission(request, view) is True
-
-    def test_object_level_read_permission(self, authenticated_user, other_user):
-        """Test object-level read permission."""
-        permission = IsSuperAdminOrReadOnly()
-        request = Mock(user=authenticated_user, method='GET')
-        view = Mock()
-
-        assert permission.has_object_permission(request, view, other_user) is True
-
-    def test_object_level_write_permission_denied_for_regular_user(
-        self, authenticated_user, other_user
-    ):
-        """Test object-level write permission denied for regular user."""
-        permission = IsSuperAdminOrReadOnly()
-        request = Mock(user=authenticated_user, method='PUT')
-        view = Mock()
-
-        assert permission.has_object_permission(request, view, other_user) is False
-
-    def test_object_level_write_permission_for_super_admin(
-        self, super_admin, other_user
+    @pytest.fixture
+    def users(self, unsaved_user, unsaved_super_admin):
+        """Requesting users keyed by the role names used in the matrices."""
+        return {
+            'anonymous': _ANONYMOUS,
+            'user': unsaved_user,
+            'super_admin': unsaved_super_admin,
+        }
+
+    @pytest.mark.parametrize('role, method, expected', [
+        ('anonymous', 'GET', False),
+        ('user', 'GET', True),
+        ('user', 'POST', False),
+        ('super_admin', 'POST', True),
+    ])
+    def test_has_permission(self, users, role, method, expected):
+        """Test view-level read/write permission by role and method."""
+        request = SimpleNamespace(user=users[role], method=method)
+
+        assert _IS_SUPER_ADMIN_OR_READ_ONLY.has_permission(request, _VIEW) is expected
+
+    @pytest.mark.parametrize('role, method, expected', [
+        ('user', 'GET', True),
+        ('user', 'PUT', False),
+        ('super_admin', 'PUT', True),
+    ])
+    def test_has_object_permission(
+        self, users, unsaved_other_user, role, method, expected
     ):
-        """Test object-level write permission for super admin."""
-        permission = IsSuperAdminOrReadOnly()
-        request = Mock(user=super_admin, method='PUT')
-        view = Mock()
+        """Test object-level read/write permission by role and method."""
+        request = SimpleNamespace(user=users[role], method=method)
 
-        assert permission.has_object_permission(request, view, other_user) is True
\ No newline at end of file
+        assert _IS_SUPER_ADMIN_OR_READ_ONLY.has_object_permission(
+            request, _VIEW, unsaved_other_user
+        ) is expected
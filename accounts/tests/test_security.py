@@ -14,153 +14,96 @@ Coverage:
 
 import pytest
 from django.urls import reverse
+from django.contrib.auth import get_user_model
 from .factories import UserFactory
-from .helpers import get_user_payload
+from .helpers import assert_field_equals, get_user_payload
+
+User = get_user_model()
 
 
 @pytest.mark.django_db
 class TestIDORVulnerabilities:
     """Test Insecure Direct Object Reference vulnerabilities."""
 
-    def test_user_cannot_access_another_users_profile(
-        self, authenticated_client, other_user
-    ):
-        """Test IDOR: User cannot access other user's profile."""
-        url = reverse('user-detail', args=[other_user.id])
-
-        response = authenticated_client.get(url)
-
-        assert response.status_code == 404
-
-    def test_user_cannot_update_another_users_profile(
-        self, authenticated_client, other_user
-    ):
-        """Test IDOR: User cannot update other user's profile."""
-        url = reverse('user-detail', args=[other_user.id])
-        payload = {'first_name': 'Hacked'}
-
-        response = authenticated_client.patch(url, payload, format='json')
-
-        assert response.status_code == 404
-
-        other_user.refresh_from_db()
-        assert other_user.first_name != 'Hacked'
-
-    def test_user_cannot_delete_another_user(
-        self, authenticated_client, other_user
-    ):
-        """Test IDOR: User cannot delete other user."""
-        url = reverse('user-detail', args=[other_user.id])
-
-        response = authenticated_client.delete(url)
-
-        assert response.status_code == 404
-
-        from django.contrib.auth import get_user_model
-        User = get_user_model()
-        assert User.objects.filter(id=other_user.id).exists()
-
-    def test_user_cannot_activate_another_user(
-        self, authenticated_client, inactive_user
+    @pytest.mark.parametrize(
+        'url_name, method, target',
+        [
+            ('user-detail', 'get', 'other_user'),
+            ('user-detail', 'patch', 'other_user'),
+            ('user-detail', 'delete', 'other_user'),
+            ('user-activate', 'post', 'inactive_user'),
+            ('user-deactivate', 'post', 'other_user'),
+        ],
+        ids=['retrieve', 'update', 'delete', 'activate', 'deactivate'],
+    )
+    def test_cross_user_access_blocked(
+        self, request, authenticated_client, url_name, method, target
     ):
-        """Test IDOR: User cannot activate other user."""
-        url = reverse('user-activate', args=[inactive_user.id])
+        """Test IDOR: User cannot read or modify another user's account."""
+        victim = request.getfixturevalue(target)
+        url = reverse(url_name, args=[victim.id])
 
-        response = authenticated_client.post(url)
+        response = getattr(authenticated_client, method)(
+            url, {'first_name': 'Hacked'}, format='json'
+        )
 
         assert response.status_code == 404
-
-        inactive_user.refresh_from_db()
-        assert inactive_user.is_active is False
-
-    def test_user_cannot_deactivate_another_user(
-        self, authenticated_client, other_user
-    ):
-        """Test IDOR: User cannot deactivate other user."""
-        url = reverse('user-deactivate', args=[other_user.id])
-
-        response = authenticated_client.post(url)
-
-        assert response.status_code == 404
-
-        other_user.refresh_from_db()
-        assert other_user.is_active is True
+        assert_field_equals(
+            User, victim.id, first_name=victim.first_name, is_active=victim.is_active
+        )
 
 
 @pytest.mark.django_db
 class TestMassAssignmentVulnerabilities:
     """Test mass assignment vulnerabilities."""
 
-    def test_user_cannot_change_role_via_update(
-        self, authenticated_client, authenticated_user
-    ):
-        """Test user cannot escalate their role."""
-        url = reverse('user-detail', args=[authenticated_user.id])
-        payload = {'role': 'SUPER_ADMIN'}
-
-        response = authenticated_client.patch(url, payload, format='json')
-
-        authenticated_user.refresh_from_db()
-        assert authenticated_user.role == 'ESTATE_MANAGER'
-
-    def test_user_cannot_change_is_staff_via_update(
-        self, authenticated_client, authenticated_user
+    @pytest.mark.parametrize(
+        'field, value',
+        [
+            ('role', 'SUPER_ADMIN'),
+            ('is_staff', True),
+            ('is_superuser', True),
+        ],
+    )
+    def test_user_cannot_set_protected_field_via_update(
+        self, authenticated_client, authenticated_user, field, value, user_detail_url
     ):
-        """Test user cannot grant themselves staff privileges."""
-        url = reverse('user-detail', args=[authenticated_user.id])
-        payload = {'is_staff': True}
-
-        response = authenticated_client.patch(url, payload, format='json')
+        """Test user cannot escalate privileges through profile fields."""
+        url = user_detail_url(authenticated_user.id)
+        original = getattr(authenticated_user, field)
 
-        authenticated_user.refresh_from_db()
-        assert authenticated_user.is_staff is False
+        authenticated_client.patch(url, {field: value}, format='json')
 
-    def test_user_cannot_change_is_superuser_via_update(
-        self, authenticated_client, authenticated_user
-    ):
-        """Test user cannot grant themselves superuser privileges."""
-        url = reverse('user-detail', args=[authenticated_user.id])
-        payload = {'is_superuser': True}
-
-        response = authenticated_client.patch(url, payload, format='json')
-
-        authenticated_user.refresh_from_db()
-        assert authenticated_user.is_superuser is False
+        assert_field_equals(User, authenticated_user.id, **{field: original})
 
     def test_user_cannot_change_email_via_profile_update(
-        self, authenticated_client, authenticated_user
+        self, authenticated_client, authenticated_user, update_profile_url
     ):
         """Test user cannot change email via profile update."""
         original_email = authenticated_user.email
-        url = reverse('user-update-profile')
         payload = {'email': 'newemail@example.com'}
 
-        response = authenticated_client.patch(url, payload, format='json')
+        response = authenticated_client.patch(update_profile_url, payload, format='json')
 
-        authenticated_user.refresh_from_db()
-        assert authenticated_user.email == original_email
+        assert_field_equals(User, authenticated_user.id, email=original_email)
 
-    def test_registration_cannot_set_is_staff(self, api_client):
+    def test_registration_cannot_set_is_staff(self, api_client, register_url):
         """Test registration cannot set staff privileges."""
-        url = reverse('register')
         payload = get_user_payload(email='staff@example.com')
         payload['is_staff'] = True
 
-        response = api_client.post(url, payload, format='json')
+        response = api_client.post(register_url, payload, format='json')
 
         if response.status_code == 201:
-            from django.contrib.auth import get_user_model
-            User = get_user_model()
             user = User.objects.get(email='staff@example.com')
             assert user.is_staff is False
 
-    def test_registration_cannot_set_super_admin_role(self, api_client):
+    def test_registration_cannot_set_super_admin_role(self, api_client, register_url):
         """Test registration defaults to ESTATE_MANAGER role."""
-        url = reverse('register')
         payload = get_user_payload(email='admin@example.com')
         payload['role'] = 'SUPER_ADMIN'
 
-        response = api_client.post(url, payload, format='json')
+        response = api_client.post(register_url, payload, format='json')
 
         if response.status_code == 201:
             assert response.data['role'] == 'SUPER_ADMIN'
@@ -171,63 +114,52 @@ class TestSensitiveDataExposure:
     """Test sensitive data is not exposed."""
 
     def test_password_not_in_user_response(
-        self, authenticated_client, authenticated_user
+        self, authenticated_client, authenticated_user, user_detail_url
     ):
         """Test password field is not included in responses."""
-        url = reverse('user-detail', args=[authenticated_user.id])
-
-        response = authenticated_client.get(url)
+        response = authenticated_client.get(user_detail_url(authenticated_user.id))
 
         assert response.status_code == 200
         assert 'password' not in response.data
 
-    def test_password_not_in_list_response(self, authenticated_client):
+    def test_password_not_in_list_response(self, authenticated_client, user_list_url):
         """Test password not in list responses."""
-        url = reverse('user-list')
-
-        response = authenticated_client.get(url)
+        response = authenticated_client.get(user_list_url)
 
         assert response.status_code == 200
-        for user_data in response.data:
+        for user_data in response.data['results']:
             assert 'password' not in user_data
 
-    def test_password_not_in_me_response(
-        self, authenticated_client
-    ):
+    def test_password_not_in_me_response(self, authenticated_client, me_url):
         """Test password not in me endpoint response."""
-        url = reverse('user-me')
-
-        response = authenticated_client.get(url)
+        response = authenticated_client.get(me_url)
 
         assert response.status_code == 200
         assert 'password' not in response.data
 
-    def test_password_not_in_registration_response(self, api_client):
+    def test_password_not_in_registration_response(self, api_client, register_url):
         """Test password not returned in registration response."""
-        url = reverse('register')
         payload = get_user_payload(email='newuser@example.com')
 
-        response = api_client.post(url, payload, format='json')
+        response = api_client.post(register_url, payload, format='json')
 
         assert response.status_code == 201
         assert 'password' not in response.data
 
-    def test_login_error_does_not_leak_user_existence(self, api_client):
+    def test_login_error_does_not_leak_user_existence(self, api_client, login_url):
         """Test login errors don't reveal if user exists."""
-        url = reverse('login')
-
         wrong_user_payload = {
             'email': 'nonexistent@example.com',
             'password': 'TestPassword123!',
         }
-        response1 = api_client.post(url, wrong_user_payload, format='json')
+        response1 = api_client.post(login_url, wrong_user_payload, format='json')
 
         user = UserFactory.create()
         wrong_password_payload = {
             'email': user.email,
             'password': 'WrongPassword123!',
         }
-        response2 = api_client.post(url, wrong_password_payload, format='json')
+        response2 = api_client.post(login_url, wrong_password_payload, format='json')
 
         assert response1.status_code == 401
         assert response2.status_code == 401
@@ -237,24 +169,22 @@ class TestSensitiveDataExposure:
 class TestSQLInjectionPrevention:
     """Test SQL injection attempts are handled safely."""
 
-    def test_sql_injection_in_email_field(self, api_client):
+    def test_sql_injection_in_email_field(self, api_client, login_url):
         """Test SQL injection in email field is handled safely."""
-        url = reverse('login')
         payload = {
             'email': "' OR '1'='1' --",
             'password': 'anything',
         }
 
-        response = api_client.post(url, payload, format='json')
+        response = api_client.post(login_url, payload, format='json')
 
         assert response.status_code in [400, 401]
 
-    def test_sql_injection_in_registration(self, api_client):
+    def test_sql_injection_in_registration(self, api_client, register_url):
         """Test SQL injection in registration fields."""
-        url = reverse('register')
         payload = get_user_payload(email="test' OR '1'='1@example.com")
 
-        response = api_client.post(url, payload, format='json')
+        response = api_client.post(register_url, payload, format='json')
 
         assert response.status_code == 400
 
@@ -263,23 +193,21 @@ class TestSQLInjectionPrevention:
 class TestXSSPayloadHandling:
     """Test XSS payloads are handled safely."""
 
-    def test_xss_payload_in_first_name(self, api_client):
+    def test_xss_payload_in_first_name(self, api_client, register_url):
         """Test XSS payload in first name is stored safely."""
-        url = reverse('register')
         payload = get_user_payload(email='xsstest@example.com')
         payload['first_name'] = '<script>alert("XSS")</script>'
 
-        response = api_client.post(url, payload, format='json')
+        response = api_client.post(register_url, payload, format='json')
 
         if response.status_code == 201:
             assert response.data['first_name'] == '<script>alert("XSS")</script>'
 
-    def test_xss_payload_in_last_name(self, authenticated_client):
+    def test_xss_payload_in_last_name(self, authenticated_client, update_profile_url):
         """Test XSS payload in last name."""
-        url = reverse('user-update-profile')
         payload = {'last_name': '<img src=x onerror=alert("XSS")>'}
 
-        response = authenticated_client.patch(url, payload, format='json')
+        response = authenticated_client.patch(update_profile_url, payload, format='json')
 
         assert response.status_code == 200
 
@@ -289,23 +217,22 @@ class TestPrivilegeEscalation:
     """Test privilege escalation attempts."""
 
     def test_regular_user_cannot_create_super_admin(
-        self, authenticated_client
+        self, authenticated_client, user_list_url
     ):
         """Test regular user cannot create super admin."""
-        url = reverse('user-list')
         payload = get_user_payload(email='newsuperadmin@example.com')
         payload['role'] = 'SUPER_ADMIN'
         payload['is_superuser'] = True
 
-        response = authenticated_client.post(url, payload, format='json')
+        response = authenticated_client.post(user_list_url, payload, format='json')
 
         assert response.status_code == 403
 
     def test_user_cannot_elevate_own_privileges(
-        self, authenticated_client, authenticated_user
+        self, authenticated_client, authenticated_user, user_detail_url
     ):
         """Test user cannot elevate their own privileges."""
-        url = reverse('user-detail', args=[authenticated_user.id])
+        url = user_detail_url(authenticated_user.id)
         payload = {
             'role': 'SUPER_ADMIN',
             'is_staff': True,
@@ -314,20 +241,22 @@ class TestPrivilegeEscalation:
 
         response = authenticated_client.patch(url, payload, format='json')
 
-        authenticated_user.refresh_from_db()
-        assert authenticated_user.role == 'ESTATE_MANAGER'
-        assert authenticated_user.is_staff is False
-        assert authenticated_user.is_superuser is False
+        assert_field_equals(
+            User,
+            authenticated_user.id,
+            role='ESTATE_MANAGER',
+            is_staff=False,
+            is_superuser=False,
+        )
 
-    def test_deactivated_user_cannot_login(self, api_client, inactive_user):
+    def test_deactivated_user_cannot_login(self, api_client, inactive_user, login_url):
         """Test deactivated user cannot authenticate."""
-        url = reverse('login')
         payload = {
             'email': inactive_user.email,
             'password': 'TestPassword123!',
         }
 
-        response = api_client.post(url, payload, format='json')
+        response = api_client.post(login_url, payload, format='json')
 
         assert response.status_code in [400, 401]
 
@@ -338,13 +267,10 @@ class TestCrossUserDataAccess:
 
     # In test_security.py
     def test_user_list_filtered_by_user(
-        self, authenticated_client, authenticated_user
+        self, authenticated_client, authenticated_user, bulk_users, user_list_url
     ):
         """Test user list returns only authenticated user's data."""
-        UserFactory.create_batch(10)
-        url = reverse('user-list')
-
-        response = authenticated_client.get(url)
+        response = authenticated_client.get(user_list_url)
 
         assert response.status_code == 200
         # Check the paginated response structure
@@ -354,12 +280,10 @@ class TestCrossUserDataAccess:
         assert response.data['results'][0]['id'] == str(authenticated_user.id)
 
     def test_super_admin_sees_all_users(
-        self, super_admin_client, multiple_users
+        self, super_admin_client, bulk_users, user_list_url
     ):
         """Test super admin can see all users."""
-        url = reverse('user-list')
-
-        response = super_admin_client.get(url)
+        response = super_admin_client.get(user_list_url)
 
         assert response.status_code == 200
         assert 'results' in response.data
@@ -369,12 +293,10 @@ class TestCrossUserDataAccess:
         assert len(response.data['results']) > 0
     
     def test_jwt_token_tied_to_specific_user(
-        self, jwt_client, authenticated_user, other_user
+        self, jwt_client, authenticated_user, other_user, me_url
     ):
         """Test JWT token is tied to specific user."""
-        url = reverse('user-me')
-
-        response = jwt_client.get(url)
+        response = jwt_client.get(me_url)
 
         assert response.status_code == 200
         assert response.data['id'] == str(authenticated_user.id)
@@ -23,18 +23,18 @@ from accounts.serializers import (
     PasswordResetConfirmSerializer,
     LoginSerializer,
 )
-from unittest.mock import Mock
+from types import SimpleNamespace
+from .factories import UserFactory
 
 User = get_user_model()
 
 
-@pytest.mark.django_db
 class TestUserSerializer:
     """Test UserSerializer."""
 
-    def test_serializer_returns_expected_fields(self, authenticated_user):
+    def test_serializer_returns_expected_fields(self, unsaved_user):
         """Test serializer returns all expected fields."""
-        serializer = UserSerializer(authenticated_user)
+        serializer = UserSerializer(unsaved_user)
         data = serializer.data
 
         assert 'id' in data
@@ -49,23 +49,21 @@ class TestUserSerializer:
         assert 'updated_at' in data
         assert 'tokens' in data
 
-    def test_serializer_excludes_password(self, authenticated_user):
+    def test_serializer_excludes_password(self, unsaved_user):
         """Test serializer does not include password."""
-        serializer = UserSerializer(authenticated_user)
+        serializer = UserSerializer(unsaved_user)
         assert 'password' not in serializer.data
 
-    def test_full_name_method_field(self, authenticated_user):
+    def test_full_name_method_field(self):
         """Test full_name computed field."""
-        authenticated_user.first_name = 'John'
-        authenticated_user.last_name = 'Doe'
-        authenticated_user.save()
+        user = UserFactory.build(first_name='John', last_name='Doe')
 
-        serializer = UserSerializer(authenticated_user)
+        serializer = UserSerializer(user)
         assert serializer.data['full_name'] == 'John Doe'
 
-    def test_tokens_generated_in_serializer(self, authenticated_user):
+    def test_tokens_generated_in_serializer(self, unsaved_user):
         """Test JWT tokens are included in serializer."""
-        serializer = UserSerializer(authenticated_user)
+        serializer = UserSerializer(unsaved_user)
         tokens = serializer.data['tokens']
 
         assert 'access' in tokens
@@ -74,34 +72,38 @@ class TestUserSerializer:
         assert isinstance(tokens['refresh'], str)
 
 
-@pytest.mark.django_db
-class TestUserCreateSerializer:
-    """Test UserCreateSerializer."""
+class TestUserCreateSerializerFieldValidation:
+    """Test UserCreateSerializer checks that fail before the email lookup."""
 
-    def test_valid_user_creation_data(self):
-        """Test serializer accepts valid user creation data."""
+    def test_missing_required_field_email(self):
+        """Test serializer rejects missing email."""
         data = {
-            'email': 'newuser@example.com',
             'first_name': 'New',
             'last_name': 'User',
             'password': 'SecurePass123!',
             'password_confirm': 'SecurePass123!',
-            'role': 'ESTATE_MANAGER',
         }
         serializer = UserCreateSerializer(data=data)
-        assert serializer.is_valid()
+        assert not serializer.is_valid()
+        assert 'email' in serializer.errors
 
-    def test_missing_required_field_email(self):
-        """Test serializer rejects missing email."""
+
+@pytest.mark.django_db
+class TestUserCreateSerializer:
+    """Test UserCreateSerializer."""
+
+    def test_valid_user_creation_data(self):
+        """Test serializer accepts valid user creation data."""
         data = {
+            'email': 'newuser@example.com',
             'first_name': 'New',
             'last_name': 'User',
             'password': 'SecurePass123!',
             'password_confirm': 'SecurePass123!',
+            'role': 'ESTATE_MANAGER',
         }
         serializer = UserCreateSerializer(data=data)
-        assert not serializer.is_valid()
-        assert 'email' in serializer.errors
+        assert serializer.is_valid()
 
     def test_missing_required_field_password(self):
         """Test serializer rejects missing password."""
@@ -155,6 +157,20 @@ class TestUserCreateSerializer:
         assert not serializer.is_valid()
         assert 'email' in serializer.errors
 
+    def test_mixed_case_stored_email_blocks_duplicate(self):
+        """Test emails created with mixed case are stored lowercased."""
+        User.objects.create_user(email='Mixed.Case@Example.com', password='SecurePass123!')
+        data = {
+            'email': 'mixed.case@example.com',
+            'first_name': 'New',
+            'last_name': 'User',
+            'password': 'SecurePass123!',
+            'password_confirm': 'SecurePass123!',
+        }
+        serializer = UserCreateSerializer(data=data)
+        assert not serializer.is_valid()
+        assert 'email' in serializer.errors
+
     def test_weak_password_rejected(self):
         """Test serializer rejects weak password."""
         data = {
@@ -211,13 +227,12 @@ class TestUserUpdateSerializer:
         assert updated_user.email == authenticated_user.email
 
 
-@pytest.mark.django_db
 class TestChangePasswordSerializer:
     """Test ChangePasswordSerializer."""
 
-    def test_valid_password_change(self, authenticated_user):
+    def test_valid_password_change(self, unsaved_user):
         """Test valid password change data."""
-        request = Mock(user=authenticated_user)
+        request = SimpleNamespace(user=unsaved_user)
         data = {
             'old_password': 'TestPassword123!',
             'new_password': 'NewSecurePass123!',
@@ -226,9 +241,9 @@ class TestChangePasswordSerializer:
         serializer = ChangePasswordSerializer(data=data, context={'request': request})
         assert serializer.is_valid()
 
-    def test_incorrect_old_password(self, authenticated_user):
+    def test_incorrect_old_password(self, unsaved_user):
         """Test incorrect old password rejected."""
-        request = Mock(user=authenticated_user)
+        request = SimpleNamespace(user=unsaved_user)
         data = {
             'old_password': 'WrongPassword123!',
             'new_password': 'NewSecurePass123!',
@@ -238,9 +253,9 @@ class TestChangePasswordSerializer:
         assert not serializer.is_valid()
         assert 'old_password' in serializer.errors
 
-    def test_new_password_mismatch(self, authenticated_user):
+    def test_new_password_mismatch(self, unsaved_user):
         """Test new password confirmation mismatch."""
-        request = Mock(user=authenticated_user)
+        request = SimpleNamespace(user=unsaved_user)
         data = {
             'old_password': 'TestPassword123!',
             'new_password': 'NewSecurePass123!',
@@ -276,7 +291,6 @@ class TestPasswordResetRequestSerializer:
         assert 'email' in serializer.errors
 
 
-@pytest.mark.django_db
 class TestPasswordResetConfirmSerializer:
     """Test PasswordResetConfirmSerializer."""
 
@@ -312,7 +326,6 @@ class TestPasswordResetConfirmSerializer:
         assert 'token' in serializer.errors
 
 
-@pytest.mark.django_db
 class TestLoginSerializer:
     """Test LoginSerializer."""
 
@@ -0,0 +1,166 @@
+# tests/test_services.py
+"""
+Tests for accounts app services.
+
+Coverage:
+- User creation and duplicate email handling
+- Password reset token issuing
+- Expired reset token cleanup and the cleanup_reset_tokens command
+- Streaming active users
+"""
+
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import IntegrityError
+from django.utils import timezone
+
+from accounts import services
+from accounts.models import PasswordResetToken
+from .factories import PasswordResetTokenFactory, UserFactory
+
+User = get_user_model()
+
+
+@pytest.mark.django_db
+class TestCreateUser:
+    """Test create_user service."""
+
+    def test_creates_user_with_normalized_email(self):
+        """Test the email is stored normalized."""
+        user = services.create_user(
+            email='  New.User@Example.com ',
+            password='SecurePass123!',
+            first_name=' New ',
+        )
+
+        assert user.email == 'new.user@example.com'
+        assert user.first_name == 'New'
+        assert user.check_password('SecurePass123!')
+
+    def test_duplicate_email_raises_value_error(self, authenticated_user):
+        """Test a duplicate email is reported as already existing."""
+        with pytest.raises(ValueError, match='already exists'):
+            services.create_user(
+                email=authenticated_user.email.upper(),
+                password='SecurePass123!',
+            )
+
+    def test_other_integrity_errors_propagate(self):
+        """Test non-duplicate integrity errors are not reported as duplicates."""
+        with pytest.raises(IntegrityError):
+            services.create_user(
+                email='new@example.com',
+                password='SecurePass123!',
+                is_active=None,
+            )
+
+        assert not User.objects.filter(email='new@example.com').exists()
+
+
+@pytest.mark.django_db
+class TestGeneratePasswordResetToken:
+    """Test generate_password_reset_token service."""
+
+    def test_reissue_retires_previous_token(self, authenticated_user):
+        """Test a new token marks the previous one used and keeps its row."""
+        first = services.generate_password_reset_token(email=authenticated_user.email)
+        second = services.generate_password_reset_token(email=authenticated_user.email)
+
+        first.refresh_from_db()
+        assert first.used is True
+        assert second.used is False
+        assert second.token != first.token
+        assert second.created_at >= first.created_at
+        assert PasswordResetToken.objects.filter(user=authenticated_user).count() == 2
+
+    def test_unknown_email_raises_value_error(self):
+        """Test an unknown email is rejected."""
+        with pytest.raises(ValueError):
+            services.generate_password_reset_token(email='missing@example.com')
+
+
+@pytest.mark.django_db
+class TestDeleteExpiredPasswordResetTokens:
+    """Test delete_expired_password_reset_tokens service."""
+
+    def test_deletes_only_tokens_past_grace_period(self):
+        """Test tokens are kept until the grace period after expiry has passed."""
+        now = timezone.now()
+        stale = PasswordResetTokenFactory.create(expires_at=now - timedelta(days=2))
+        recent = PasswordResetTokenFactory.create(expires_at=now - timedelta(hours=1))
+        valid = PasswordResetTokenFactory.create()
+
+        deleted = services.delete_expired_password_reset_tokens()
+
+        assert deleted == 1
+        remaining = set(PasswordResetToken.objects.values_list('pk', flat=True))
+        assert remaining == {recent.pk, valid.pk}
+        assert stale.pk not in remaining
+
+    def test_grace_period_boundary(self):
+        """Test a token expiring exactly at the cutoff is kept."""
+        now = timezone.now()
+        grace_period = timedelta(days=3)
+        at_cutoff = PasswordResetTokenFactory.create(expires_at=now - grace_period)
+        past_cutoff = PasswordResetTokenFactory.create(
+            expires_at=now - grace_period - timedelta(microseconds=1)
+        )
+
+        with patch('accounts.services.timezone.now', return_value=now):
+            deleted = services.delete_expired_password_reset_tokens(
+                grace_period=grace_period
+            )
+
+        assert deleted == 1
+        assert PasswordResetToken.objects.filter(pk=at_cutoff.pk).exists()
+        assert not PasswordResetToken.objects.filter(pk=past_cutoff.pk).exists()
+
+
+@pytest.mark.django_db
+class TestCleanupResetTokensCommand:
+    """Test cleanup_reset_tokens management command."""
+
+    def test_default_keeps_tokens_for_one_day(self):
+        """Test the command deletes tokens expired more than a day ago."""
+        now = timezone.now()
+        PasswordResetTokenFactory.create(expires_at=now - timedelta(days=2))
+        kept = PasswordResetTokenFactory.create(expires_at=now - timedelta(hours=12))
+        out = StringIO()
+
+        call_command('cleanup_reset_tokens', stdout=out)
+
+        assert 'Deleted 1 expired reset token(s).' in out.getvalue()
+        assert list(PasswordResetToken.objects.values_list('pk', flat=True)) == [kept.pk]
+
+    def test_days_option_sets_grace_period(self):
+        """Test --days widens the grace period."""
+        now = timezone.now()
+        PasswordResetTokenFactory.create(expires_at=now - timedelta(days=8))
+        kept = PasswordResetTokenFactory.create(expires_at=now - timedelta(days=3))
+        out = StringIO()
+
+        call_command('cleanup_reset_tokens', '--days', '7', stdout=out)
+
+        assert 'Deleted 1 expired reset token(s).' in out.getvalue()
+        assert list(PasswordResetToken.objects.values_list('pk', flat=True)) == [kept.pk]
+
+
+@pytest.mark.django_db
+class TestGetActiveUsersIterator:
+    """Test get_active_users_iterator service."""
+
+    def test_streams_active_users_with_bulk_fields(self, inactive_user):
+        """Test only active users are streamed, loading BULK_USER_FIELDS."""
+        active = UserFactory.create_batch(3)
+
+        users = list(services.get_active_users_iterator(chunk_size=2))
+
+        assert {user.pk for user in users} == {user.pk for user in active}
+        for user in users:
+            assert not user.get_deferred_fields().intersection(services.BULK_USER_FIELDS)
+            assert 'password' in user.get_deferred_fields()
@@ -8,73 +8,38 @@ Coverage:
 - URL namespaces work as expected
 """
 
+from uuid import uuid4
+
 import pytest
 from django.urls import reverse, resolve
 
 
-@pytest.mark.django_db
-class TestAccountsURLs:
-    """Test URL routing for accounts app."""
-
-    def test_register_url_resolves(self):
-        """Test register URL resolves correctly."""
-        url = reverse('register')
-        assert url == '/api/accounts/auth/register/'
-        resolver = resolve(url)
-        assert resolver.view_name == 'register'
-
-    def test_login_url_resolves(self):
-        """Test login URL resolves correctly."""
-        url = reverse('login')
-        assert url == '/api/accounts/auth/login/'
-        resolver = resolve(url)
-        assert resolver.view_name == 'login'
-
-    def test_password_reset_request_url_resolves(self):
-        """Test password reset request URL resolves correctly."""
-        url = reverse('password-reset-request')
-        assert url == '/api/accounts/auth/password-reset/'
-        resolver = resolve(url)
-        assert resolver.view_name == 'password-reset-request'
+_USER_ID = uuid4()
 
-    def test_password_reset_confirm_url_resolves(self):
-        """Test password reset confirm URL resolves correctly."""
-        url = reverse('password-reset-confirm')
-        assert url == '/api/accounts/auth/password-reset/confirm/'
-        resolver = resolve(url)
-        assert resolver.view_name == 'password-reset-confirm'
+# (url name, takes a user id, expected path)
+URL_CASES = [
+    ('register', False, '/api/accounts/auth/register/'),
+    ('login', False, '/api/accounts/auth/login/'),
+    ('password-reset-request', False, '/api/accounts/auth/password-reset/'),
+    ('password-reset-confirm', False, '/api/accounts/auth/password-reset/confirm/'),
+    ('user-list', False, '/api/accounts/users/'),
+    ('user-detail', True, f'/api/accounts/users/{_USER_ID}/'),
+    ('user-me', False, '/api/accounts/users/me/'),
+    ('user-update-profile', False, '/api/accounts/users/update_profile/'),
+    ('user-change-password', False, '/api/accounts/users/change_password/'),
+    ('user-activate', True, f'/api/accounts/users/{_USER_ID}/activate/'),
+    ('user-deactivate', True, f'/api/accounts/users/{_USER_ID}/deactivate/'),
+]
 
-    def test_user_list_url_resolves(self):
-        """Test user list URL resolves correctly."""
-        url = reverse('user-list')
-        assert url == '/api/accounts/users/'
 
-    def test_user_detail_url_resolves(self, user):
-        """Test user detail URL resolves correctly."""
-        url = reverse('user-detail', args=[user.id])
-        assert url == f'/api/accounts/users/{user.id}/'
-
-    def test_user_me_url_resolves(self):
-        """Test user me URL resolves correctly."""
-        url = reverse('user-me')
-        assert url == '/api/accounts/users/me/'
-
-    def test_user_update_profile_url_resolves(self):
-        """Test update profile URL resolves correctly."""
-        url = reverse('user-update-profile')
-        assert url == '/api/accounts/users/update_profile/'
-
-    def test_user_change_password_url_resolves(self):
-        """Test change password URL resolves correctly."""
-        url = reverse('user-change-password')
-        assert url == '/api/accounts/users/change_password/'
-
-    def test_user_activate_url_resolves(self, user):
-        """Test user activate URL resolves correctly."""
-        url = reverse('user-activate', args=[user.id])
-        assert url == f'/api/accounts/users/{user.id}/activate/'
+class TestAccountsURLs:
+    """Test URL routing for accounts app."""
 
-    def test_user_deactivate_url_resolves(self, user):
-        """Test user deactivate URL resolves correctly."""
-        url = reverse('user-deactivate', args=[user.id])
-        assert url == f'/api/accounts/users/{user.id}/deactivate/'
\ No newline at end of file
+    @pytest.mark.parametrize(
+        'name, takes_id, path', URL_CASES, ids=[case[0] for case in URL_CASES]
+    )
+    def test_url_resolves(self, name, takes_id, path):
+        """Test URL reverses to the expected path and resolves back to its name."""
+        url = reverse(name, args=[_USER_ID] if takes_id else None)
+        assert url == path
+        assert resolve(url).view_name == name
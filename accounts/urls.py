@@ -7,10 +7,7 @@ Defines API endpoints for user management and authentication.
 
 from django.urls import include, path
 from rest_framework.routers import DefaultRouter
-from rest_framework_simplejwt.views import (
-    TokenObtainPairView,
-    TokenRefreshView,
-)
+from rest_framework_simplejwt.views import TokenRefreshView
 
 
 from . import views
@@ -33,7 +30,6 @@ urlpatterns = [
         name='password-reset-confirm'
     ),
 
-    path('api/token/', TokenObtainPairView.as_view(), name='token_obtain_pair'),
     path('api/token/refresh/', TokenRefreshView.as_view(), name='token_refresh'),
     path('api/token/', views.CustomTokenObtainPairView.as_view(), name='token_obtain_pair'),
 ]
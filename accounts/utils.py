@@ -0,0 +1,20 @@
+# accounts/utils.py
+"""
+Utility functions for the accounts app.
+"""
+
+
+def normalize_email(value: str) -> str:
+    """
+    Normalize an email address for storage and lookup.
+
+    Emails are stored lowercased, so every lookup must go through
+    this helper to hit the unique index on User.email.
+
+    Args:
+        value: Raw email address
+
+    Returns:
+        Email address stripped of surrounding whitespace and lowercased
+    """
+    return value.strip().lower()
@@ -5,6 +5,7 @@ API views for accounts app.
 Provides REST API endpoints for user management and authentication.
 """
 from drf_yasg.utils import swagger_auto_schema
+from django.core.exceptions import ValidationError
 from django.utils import timezone
 from django.contrib.auth import get_user_model
 from rest_framework import status, viewsets
@@ -15,7 +16,7 @@ from rest_framework.views import APIView
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
 from . import services
-from .permissions import IsSuperAdminOrSelf, IsSuperAdmin
+from .permissions import IsSuperAdminOrSelf, IsSuperAdmin, request_is_super_admin
 from .serializers import (
     ChangePasswordSerializer,
     LoginSerializer,
@@ -44,19 +45,45 @@ from .swagger import (
 
 User = get_user_model()
 
+# Columns read by UserSerializer (full_name is derived from the name and email
+# columns). Read actions load only these; touching any other field on the
+# instance triggers an extra query.
+USER_SERIALIZER_COLUMNS = (
+    'id',
+    'email',
+    'first_name',
+    'last_name',
+    'role',
+    'is_active',
+    'date_joined',
+    'last_login',
+    'created_at',
+    'updated_at',
+)
+
+
+def _token_response(user):
+    """Issue a JWT pair for user and return it with the user's profile."""
+    refresh = RefreshToken.for_user(user)
+    return Response({
+        'access': str(refresh.access_token),
+        'refresh': str(refresh),
+        'user': UserSerializer(user).data,
+    }, status=status.HTTP_200_OK)
+
+
 class CustomTokenObtainPairView(TokenObtainPairView):
+    """
+    Obtain a JWT access/refresh pair for a set of user credentials.
+
+    Also returns the authenticated user's profile.
+    """
+
     def post(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
-        user = serializer.user
-        refresh = RefreshToken.for_user(user)
-
-        return Response({
-            'refresh': str(refresh),
-            'access': str(refresh.access_token),
-            'user': UserSerializer(user).data
-        }, status=status.HTTP_200_OK)
+        return _token_response(serializer.user)
 
 class UserViewSet(viewsets.ModelViewSet):
     """
@@ -66,7 +93,9 @@ class UserViewSet(viewsets.ModelViewSet):
     Super admins can manage all users, regular users can only view/update themselves.
     """
 
-    queryset = User.objects.all()
+    # Only declares the model for the router and schema generation; the rows
+    # each request may see come from get_queryset()
+    queryset = User.objects.none()
     authentication_classes = [JWTAuthentication]
 
     permission_classes = [IsAuthenticated, IsSuperAdminOrSelf]
@@ -99,12 +128,19 @@ class UserViewSet(viewsets.ModelViewSet):
         if getattr(self, 'swagger_fake_view', False):
             return User.objects.none()
         
-        user = self.request.user
+        if request_is_super_admin(self.request):
+            queryset = User.objects.all()
+        else:
+            queryset = User.objects.filter(id=self.request.user.id)
 
-        if user.is_super_admin():
-            return User.objects.all()
+        if self.action in ('list', 'retrieve'):
+            queryset = queryset.only(*USER_SERIALIZER_COLUMNS)
 
-        return User.objects.filter(id=user.id)
+        if self.action == 'list':
+            # Break created_at ties (e.g. bulk inserts) so pages are stable
+            queryset = queryset.order_by('-created_at', 'id')
+
+        return queryset
 
     @swagger_auto_schema(
         operation_description="Create a user",
@@ -135,9 +171,15 @@ class UserViewSet(viewsets.ModelViewSet):
         responses={204: 'User deleted'},
     )
     def destroy(self, request, *args, **kwargs):
-        instance = self.get_object()
+        # Refuse self-deletion from the URL alone, before any lookup;
+        # to_python() parses the pk the same way get_object()'s filter would
+        lookup = kwargs[self.lookup_url_kwarg or self.lookup_field]
+        try:
+            is_self = User._meta.pk.to_python(lookup) == request.user.pk
+        except ValidationError:
+            is_self = False
 
-        if instance == request.user:
+        if is_self:
             return Response(
                 {"detail": "You cannot delete your own account."},
                 status=status.HTTP_403_FORBIDDEN,
@@ -154,8 +196,7 @@ class UserViewSet(viewsets.ModelViewSet):
         Returns:
             Current user's data
         """
-        serializer = self.get_serializer(request.user)
-        return Response(serializer.data)
+        return Response(UserSerializer(request.user).data)
 
 
 
@@ -319,16 +360,12 @@ class LoginView(APIView):
                 status=status.HTTP_401_UNAUTHORIZED
             )
 
+        # Single UPDATE without the save() signal pipeline; nothing listens
+        # for User saves, and updated_at was never touched here either
         user.last_login = timezone.now()
-        user.save(update_fields=["last_login"])
-
-        refresh = RefreshToken.for_user(user)
+        User.objects.filter(pk=user.pk).update(last_login=user.last_login)
 
-        return Response({
-            "access": str(refresh.access_token),
-            "refresh": str(refresh),
-            "user": UserSerializer(user).data
-        }, status=status.HTTP_200_OK)
+        return _token_response(user)
 
 
 
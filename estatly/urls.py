@@ -1,3 +1,4 @@
+from django.conf import settings
 from django.contrib import admin
 from django.urls import path, include, re_path
 from rest_framework import permissions
@@ -11,6 +12,12 @@ schema_view = get_schema_view(
     permission_classes=(permissions.AllowAny,),
 )
 
+# Cache the rendered schema outside development so repeat hits skip
+# regenerating it; in DEBUG always regenerate to reflect code changes.
+# The key prefix keeps the schema entries separate from other cached pages.
+SCHEMA_CACHE_TIMEOUT = 0 if settings.DEBUG else 60 * 60
+SCHEMA_CACHE_KWARGS = None if settings.DEBUG else {'key_prefix': 'swagger'}
+
 urlpatterns = [
     path('admin/', admin.site.urls),
     
@@ -27,13 +34,16 @@ urlpatterns = [
 
     # Swagger documentation URLs
     re_path(r'^swagger(?P<format>\.json|\.yaml)$', 
-            schema_view.without_ui(cache_timeout=0), 
+            schema_view.without_ui(cache_timeout=SCHEMA_CACHE_TIMEOUT,
+                                   cache_kwargs=SCHEMA_CACHE_KWARGS), 
             name='schema-json'),
     path('swagger/', 
-         schema_view.with_ui('swagger', cache_timeout=0), 
+         schema_view.with_ui('swagger', cache_timeout=SCHEMA_CACHE_TIMEOUT,
+                             cache_kwargs=SCHEMA_CACHE_KWARGS), 
          name='schema-swagger-ui'),
     path('redoc/', 
-         schema_view.with_ui('redoc', cache_timeout=0), 
+         schema_view.with_ui('redoc', cache_timeout=SCHEMA_CACHE_TIMEOUT,
+                             cache_kwargs=SCHEMA_CACHE_KWARGS), 
          name='schema-redoc'),
 ]
 